@@ -1,12 +1,15 @@
 """Configuration models and loading for focusgroup sessions."""
 
+import functools
 import importlib.resources
-import tomllib
+import keyword
+from collections.abc import Mapping
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class SessionMode(str, Enum):
@@ -40,9 +43,20 @@ class SchemaFieldType(str, Enum):
     BOOLEAN = "boolean"  # Yes/no
 
 
+# JSON Schema "type" for each field type
+_JSON_SCHEMA_TYPES: dict[SchemaFieldType, str] = {
+    SchemaFieldType.INTEGER: "integer",
+    SchemaFieldType.STRING: "string",
+    SchemaFieldType.LIST: "array",
+    SchemaFieldType.BOOLEAN: "boolean",
+}
+
+
 class SchemaField(BaseModel):
     """A single field in a structured feedback schema."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: SchemaFieldType = SchemaFieldType.STRING
     description: str | None = None  # Help text for the agent
@@ -54,7 +68,7 @@ class SchemaField(BaseModel):
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Ensure field name is a valid identifier."""
-        if not v.isidentifier():
+        if not v.isidentifier() or keyword.iskeyword(v):
             raise ValueError(f"Field name must be a valid identifier: {v}")
         return v
 
@@ -72,9 +86,14 @@ class FeedbackSchema(BaseModel):
             SchemaField(name="cons", type=SchemaFieldType.LIST),
             SchemaField(name="summary", type=SchemaFieldType.STRING),
         ])
+
+    Schemas are frozen, with fields stored as a tuple, because the built-in
+    presets are shared instances.
     """
 
-    fields: list[SchemaField] = Field(min_length=1)
+    model_config = ConfigDict(frozen=True)
+
+    fields: tuple[SchemaField, ...] = Field(min_length=1)
     include_raw_response: bool = True  # Also include unstructured response
 
     def to_json_schema(self) -> dict:
@@ -83,21 +102,18 @@ class FeedbackSchema(BaseModel):
         required = []
 
         for field in self.fields:
-            prop: dict = {"description": field.description or f"The {field.name} field"}
+            prop: dict = {
+                "description": field.description or f"The {field.name} field",
+                "type": _JSON_SCHEMA_TYPES[field.type],
+            }
 
             if field.type == SchemaFieldType.INTEGER:
-                prop["type"] = "integer"
                 if field.min_value is not None:
                     prop["minimum"] = field.min_value
                 if field.max_value is not None:
                     prop["maximum"] = field.max_value
-            elif field.type == SchemaFieldType.STRING:
-                prop["type"] = "string"
             elif field.type == SchemaFieldType.LIST:
-                prop["type"] = "array"
                 prop["items"] = {"type": "string"}
-            elif field.type == SchemaFieldType.BOOLEAN:
-                prop["type"] = "boolean"
 
             properties[field.name] = prop
             if field.required:
@@ -333,12 +349,29 @@ def load_config(path: Path) -> FocusgroupConfig:
 
     Raises:
         FileNotFoundError: If config file doesn't exist
+        UnicodeDecodeError: If the file is not valid UTF-8
         tomllib.TOMLDecodeError: If TOML is malformed
         pydantic.ValidationError: If config doesn't match schema
     """
-    with open(path, "rb") as f:
-        data = tomllib.load(f)
-    return FocusgroupConfig.model_validate(data)
+    return load_config_str(Path(path).read_bytes().decode("utf-8"))
+
+
+def load_config_str(text: str) -> FocusgroupConfig:
+    """Load and validate configuration from a TOML string.
+
+    Args:
+        text: TOML document contents
+
+    Returns:
+        Validated FocusgroupConfig
+
+    Raises:
+        tomllib.TOMLDecodeError: If TOML is malformed
+        pydantic.ValidationError: If config doesn't match schema
+    """
+    import tomllib
+
+    return FocusgroupConfig.model_validate(tomllib.loads(text))
 
 
 def load_agent_preset(path: Path) -> AgentConfig:
@@ -355,8 +388,25 @@ def load_agent_preset(path: Path) -> AgentConfig:
         tomllib.TOMLDecodeError: If TOML is malformed
         pydantic.ValidationError: If config doesn't match schema
     """
+    import tomllib
+
     with open(path, "rb") as f:
         data = tomllib.load(f)
+    return load_agent_preset_from_dict(data)
+
+
+def load_agent_preset_from_dict(data: dict) -> AgentConfig:
+    """Validate an already-parsed agent preset.
+
+    Args:
+        data: Preset contents, either bare or nested under an "agent" table
+
+    Returns:
+        Validated AgentConfig
+
+    Raises:
+        pydantic.ValidationError: If config doesn't match schema
+    """
     # Agent presets have the config nested under [agent]
     agent_data = data.get("agent", data)
     return AgentConfig.model_validate(agent_data)
@@ -379,11 +429,15 @@ def get_agents_dir() -> Path:
     return agents_dir
 
 
-def _get_bundled_presets() -> dict[str, Path]:
+@functools.cache
+def _get_bundled_presets() -> Mapping[str, Path]:
     """Get bundled presets from the package.
 
+    The package contents don't change at runtime, so the scan is done once
+    and shared as a read-only mapping.
+
     Returns:
-        Dictionary mapping preset name to path within the package.
+        Mapping of preset name to path within the package.
     """
     presets = {}
     try:
@@ -397,7 +451,7 @@ def _get_bundled_presets() -> dict[str, Path]:
     except (ModuleNotFoundError, TypeError):
         # Package not installed or presets dir doesn't exist
         pass
-    return presets
+    return MappingProxyType(presets)
 
 
 def list_agent_presets() -> list[tuple[str, Path]]:
@@ -411,7 +465,7 @@ def list_agent_presets() -> list[tuple[str, Path]]:
         List of (name, path) tuples for each preset
     """
     # Start with bundled presets
-    presets = _get_bundled_presets()
+    presets = dict(_get_bundled_presets())
 
     # User presets override bundled ones
     agents_dir = get_agents_dir()
@@ -473,6 +527,8 @@ def load_custom_providers() -> dict[str, dict]:
     if not providers_path.exists():
         return {}
 
+    import tomllib
+
     with open(providers_path, "rb") as f:
         data = tomllib.load(f)
 
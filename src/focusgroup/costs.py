@@ -8,6 +8,7 @@ provider pricing which can change.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -32,7 +33,15 @@ EXPLORATION_MULTIPLIER = 3.0
 SYNTHESIS_OVERHEAD = 0.02
 
 
-@dataclass
+class WarningCode(str, Enum):
+    """Machine-readable identifiers for cost warnings."""
+
+    LARGE_PANEL = "large_panel"  # More than 5 agents
+    EXPLORATION_MANY_AGENTS = "exploration_many_agents"  # Exploration with >3 agents
+    MULTIPLE_ROUNDS = "multiple_rounds"  # More than one question round
+
+
+@dataclass(frozen=True, slots=True)
 class CostEstimate:
     """Estimated cost breakdown for a session.
 
@@ -45,6 +54,8 @@ class CostEstimate:
         is_exploration: Whether exploration mode is enabled
         has_synthesis: Whether synthesis is enabled
         confidence: Estimate confidence level
+        warnings: Human-readable notes about expensive settings
+        warning_codes: WarningCode for each entry in warnings
     """
 
     base_cost: float
@@ -56,6 +67,7 @@ class CostEstimate:
     has_synthesis: bool
     confidence: str = "rough"  # "rough" or "moderate"
     warnings: list[str] = field(default_factory=list)
+    warning_codes: frozenset[WarningCode] = frozenset()
 
     def format_short(self) -> str:
         """Format as short inline text."""
@@ -147,11 +159,13 @@ def estimate_cost(
     total_cost = base_cost + exploration_cost + synthesis_cost
 
     # Add warnings for expensive configurations
-    warnings = []
+    warnings: dict[WarningCode, str] = {}
     if agent_count > 5:
-        warnings.append(f"Large panel ({agent_count} agents) increases cost")
+        warnings[WarningCode.LARGE_PANEL] = f"Large panel ({agent_count} agents) increases cost"
     if exploration and agent_count > 3:
-        warnings.append("Exploration mode with many agents can be costly")
+        warnings[WarningCode.EXPLORATION_MANY_AGENTS] = (
+            "Exploration mode with many agents can be costly"
+        )
 
     return CostEstimate(
         base_cost=base_cost,
@@ -161,7 +175,8 @@ def estimate_cost(
         agent_count=agent_count,
         is_exploration=exploration,
         has_synthesis=synthesis,
-        warnings=warnings,
+        warnings=list(warnings.values()),
+        warning_codes=frozenset(warnings),
     )
 
 
@@ -196,13 +211,15 @@ def estimate_from_config(config: FocusgroupConfig) -> CostEstimate:
 
     total_cost = base_cost + exploration_cost + synthesis_cost
 
-    warnings = []
+    warnings: dict[WarningCode, str] = {}
     if agent_count > 5:
-        warnings.append(f"Large panel ({agent_count} agents) increases cost")
+        warnings[WarningCode.LARGE_PANEL] = f"Large panel ({agent_count} agents) increases cost"
     if exploration and agent_count > 3:
-        warnings.append("Exploration mode with many agents can be costly")
+        warnings[WarningCode.EXPLORATION_MANY_AGENTS] = (
+            "Exploration mode with many agents can be costly"
+        )
     if rounds > 1:
-        warnings.append(f"Multiple rounds ({rounds}) multiply agent costs")
+        warnings[WarningCode.MULTIPLE_ROUNDS] = f"Multiple rounds ({rounds}) multiply agent costs"
 
     return CostEstimate(
         base_cost=base_cost,
@@ -212,7 +229,8 @@ def estimate_from_config(config: FocusgroupConfig) -> CostEstimate:
         agent_count=agent_count,
         is_exploration=exploration,
         has_synthesis=synthesis,
-        warnings=warnings,
+        warnings=list(warnings.values()),
+        warning_codes=frozenset(warnings),
     )
 
 
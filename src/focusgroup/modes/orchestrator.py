@@ -317,16 +317,18 @@ class SessionOrchestrator:
         else:
             context = None
 
-        # Get feedback schema if configured
+        # Get feedback schema if configured; its instructions are the same
+        # for every round, so render them once up front
         feedback_schema = self._config.session.feedback_schema
+        schema_instructions = feedback_schema.to_prompt_instructions() if feedback_schema else None
 
         # Run each question round
         questions = self._config.questions.rounds
         for i, question in enumerate(questions):
             # Add schema instructions to prompt if schema is configured
             augmented_prompt = question
-            if feedback_schema:
-                augmented_prompt = self._add_schema_instructions(question, feedback_schema)
+            if schema_instructions:
+                augmented_prompt = self._add_schema_instructions(question, schema_instructions)
 
             # Run the round using the configured mode
             result = await self._mode.run_round(
@@ -412,17 +414,16 @@ class SessionOrchestrator:
 Run commands now to form your opinion based on real usage, not just documentation."""
         return context + instructions
 
-    def _add_schema_instructions(self, prompt: str, schema: FeedbackSchema) -> str:
+    def _add_schema_instructions(self, prompt: str, instructions: str) -> str:
         """Add structured feedback schema instructions to prompt.
 
         Args:
             prompt: The base question/prompt
-            schema: The feedback schema to enforce
+            instructions: Rendered FeedbackSchema.to_prompt_instructions() text
 
         Returns:
             Prompt with schema instructions appended
         """
-        instructions = schema.to_prompt_instructions()
         return f"{prompt}\n\n{instructions}"
 
     def _record_round(
@@ -8,7 +8,7 @@ to be used interchangeably.
 """
 
 from pathlib import Path
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 from focusgroup.storage.session_log import SessionLog
 
@@ -16,6 +16,7 @@ from .json_writer import JsonWriter, format_json
 from .markdown import MarkdownWriter, TextWriter, format_markdown, format_text
 
 
+@runtime_checkable
 class OutputFormatter(Protocol):
     """Protocol for session output formatters.
 
@@ -1,6 +1,6 @@
 """Session logging infrastructure for persisting focusgroup sessions."""
 
-import json
+import os
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -66,8 +66,6 @@ def _get_default_log_dir() -> Path:
     Returns:
         Path to the log directory
     """
-    import os
-
     # Allow override via environment variable
     if env_dir := os.environ.get("FOCUSGROUP_LOG_DIR"):
         return Path(env_dir)
@@ -108,8 +106,10 @@ class SessionStorage:
             Path to the saved file
         """
         path = self._get_session_path(session.display_id)
-        with open(path, "w") as f:
-            json.dump(session.model_dump(mode="json"), f, indent=2, default=str)
+        # Write to a sibling temp file and rename so readers never see a partial log
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(session.model_dump_json(indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
         return path
 
     def load(self, session_id: str) -> SessionLog:
@@ -135,9 +135,7 @@ class SessionStorage:
                 raise ValueError(f"Ambiguous session ID '{session_id}', matches: {matches}")
             path = matches[0]
 
-        with open(path) as f:
-            data = json.load(f)
-        return SessionLog.model_validate(data)
+        return SessionLog.model_validate_json(path.read_bytes())
 
     def list_sessions(
         self,
@@ -158,9 +156,7 @@ class SessionStorage:
         sessions = []
         for path in sorted(self.base_dir.glob("*.json"), reverse=True):
             try:
-                with open(path) as f:
-                    data = json.load(f)
-                session = SessionLog.model_validate(data)
+                session = SessionLog.model_validate_json(path.read_bytes())
 
                 if tool_filter and tool_filter not in session.tool:
                     continue
@@ -171,7 +167,7 @@ class SessionStorage:
                 sessions.append(session)
                 if len(sessions) >= limit:
                     break
-            except (json.JSONDecodeError, ValueError):
+            except ValueError:
                 continue  # Skip malformed files
 
         return sessions
@@ -185,11 +181,11 @@ class SessionStorage:
         Returns:
             True if deleted, False if not found
         """
-        path = self._get_session_path(session_id)
-        if path.exists():
-            path.unlink()
-            return True
-        return False
+        try:
+            self._get_session_path(session_id).unlink()
+        except FileNotFoundError:
+            return False
+        return True
 
 
 def get_default_storage() -> SessionStorage:
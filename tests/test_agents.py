@@ -24,7 +24,6 @@ class TestMockAgent:
         """Clear call log before each test."""
         MockAgent.clear_call_log()
 
-    @pytest.mark.asyncio
     async def test_respond_returns_response(self):
         """Mock agent returns a valid AgentResponse."""
         agent = create_mock_agent(name="TestAgent")
@@ -35,7 +34,6 @@ class TestMockAgent:
         assert response.content is not None
         assert "What do you think" in response.content
 
-    @pytest.mark.asyncio
     async def test_respond_with_context(self):
         """Mock agent handles context parameter."""
         agent = create_mock_agent()
@@ -47,7 +45,6 @@ class TestMockAgent:
         assert len(log) == 1
         assert log[0] == ("Question?", "Some context")
 
-    @pytest.mark.asyncio
     async def test_respond_with_custom_template(self):
         """Mock agent uses custom response template."""
         agent = create_mock_agent(response_template="Custom: {prompt} - END")
@@ -55,7 +52,6 @@ class TestMockAgent:
 
         assert response.content == "Custom: Hello - END"
 
-    @pytest.mark.asyncio
     async def test_respond_tracks_metadata(self):
         """Mock agent includes token and latency metadata."""
         agent = create_mock_agent(
@@ -70,7 +66,6 @@ class TestMockAgent:
         assert response.tokens_out == 200
         assert response.model == "mock-model-v1"
 
-    @pytest.mark.asyncio
     async def test_respond_can_fail(self):
         """Mock agent can simulate failures."""
         agent = create_mock_agent(
@@ -81,7 +76,6 @@ class TestMockAgent:
         with pytest.raises(RuntimeError, match="Simulated API error"):
             await agent.respond("Test")
 
-    @pytest.mark.asyncio
     async def test_stream_respond(self):
         """Mock agent streams response in chunks."""
         agent = create_mock_agent(response_template="Hello world test")
@@ -102,7 +96,6 @@ class TestMockAgent:
         full_response = "".join(c.content for c in chunks)
         assert full_response.strip() == "Hello world test"
 
-    @pytest.mark.asyncio
     async def test_stream_respond_can_fail(self):
         """Mock agent streaming can simulate failures."""
         agent = create_mock_agent(
@@ -1,62 +1,27 @@
 """Integration tests for CLI commands."""
 
-from datetime import datetime
+import io
+import shutil
+from datetime import datetime, timedelta
 from pathlib import Path
 from subprocess import CompletedProcess
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
-from focusgroup.cli import app, infer_tool_from_context
+import focusgroup.cli as cli_mod
+from focusgroup.cli import app, infer_tool_from_context, status_print
+from focusgroup.cli import ask as ask_cmd
+from focusgroup.cli import demo as demo_cmd
 from focusgroup.storage.session_log import AgentResponse, QuestionRound, SessionLog
 
-runner = CliRunner()
+# Fixed timestamp for session logs so test output is deterministic
+_FIXED_NOW = datetime(2025, 1, 1, 12, 0, 0)
 
+# Session configs shared by the run and config-validation tests
 
-class TestMainApp:
-    """Test main CLI app."""
-
-    def test_help_shows_description(self):
-        """Help text shows application description."""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "Gather feedback from multiple LLM agents" in result.stdout
-
-    def test_version_flag(self):
-        """--version flag shows version."""
-        result = runner.invoke(app, ["--version"])
-        assert result.exit_code == 0
-        assert "focusgroup" in result.stdout.lower()
-
-    def test_no_args_shows_help(self):
-        """Running without args shows help (exit code 2 due to no_args_is_help)."""
-        result = runner.invoke(app, [])
-        # Typer with no_args_is_help=True returns exit code 0, but shows usage
-        # The help text should be shown regardless
-        assert "Usage:" in result.stdout or "Commands:" in result.stdout
-
-
-class TestRunCommand:
-    """Test 'run' command."""
-
-    def test_run_missing_config(self, tmp_path: Path):
-        """Run with non-existent config shows error."""
-        result = runner.invoke(app, ["run", str(tmp_path / "missing.toml")])
-        assert result.exit_code == 1
-        assert "not found" in result.stdout.lower()
-
-    def test_run_invalid_config(self, tmp_path: Path):
-        """Run with invalid config shows error."""
-        bad_config = tmp_path / "bad.toml"
-        bad_config.write_text("not valid toml = = =")
-
-        result = runner.invoke(app, ["run", str(bad_config)])
-        assert result.exit_code == 1
-        assert "failed" in result.stdout.lower()
-
-    def test_run_dry_run(self, tmp_path: Path):
-        """Dry run shows session plan without executing."""
-        config_content = """
+_DRY_RUN_CONFIG = """
 [session]
 name = "Test Session"
 mode = "single"
@@ -83,54 +48,230 @@ rounds = [
 [output]
 format = "json"
 """
-        config_file = tmp_path / "session.toml"
-        config_file.write_text(config_content)
 
-        result = runner.invoke(app, ["run", str(config_file), "--dry-run"])
+_CONFIG_MISSING_TOOL = """
+[[agents]]
+provider = "claude"
 
-        assert result.exit_code == 0
-        assert "Session Plan" in result.stdout
-        assert "mx" in result.stdout
-        assert "single" in result.stdout
-        assert "enabled" in result.stdout  # moderator
-        assert "Claude Expert" in result.stdout
-        assert "Codex Expert" in result.stdout
-        assert "How usable" in result.stdout
-        assert "2" in result.stdout  # Two questions
-
-    def test_run_dry_run_json_output(self, tmp_path: Path):
-        """Dry run with --json outputs parseable JSON."""
-        import json
+[questions]
+rounds = ["Test?"]
+"""
 
-        config_content = """
-[session]
-name = "Test Session"
-mode = "single"
-moderator = true
+_CONFIG_MISSING_AGENTS = """
+[tool]
+command = "mx"
 
+[questions]
+rounds = ["Test?"]
+"""
+
+_CONFIG_MISSING_QUESTIONS = """
 [tool]
 command = "mx"
 
 [[agents]]
 provider = "claude"
-name = "Claude Expert"
-model = "claude-sonnet-4-20250514"
+"""
+
+_CONFIG_EMPTY_QUESTIONS = """
+[tool]
+command = "mx"
 
 [[agents]]
-provider = "codex"
-name = "Codex Expert"
+provider = "claude"
 
 [questions]
-rounds = [
-    "How usable is this CLI?",
-    "What would you improve?"
+rounds = []
+"""
+
+
+@pytest.fixture(scope="session")
+def preset_template_dir(tmp_path_factory) -> Path:
+    """Build the config/agents layout with two presets once per session."""
+    template = tmp_path_factory.mktemp("preset_template")
+    agents_dir = template / "config" / "agents"
+    agents_dir.mkdir(parents=True)
+    (agents_dir / "expert.toml").write_text('[agent]\nprovider = "claude"')
+    (agents_dir / "reviewer.toml").write_text('[agent]\nprovider = "codex"')
+    return template
+
+
+@pytest.fixture
+def preset_dir(preset_template_dir: Path, tmp_path: Path, monkeypatch) -> Path:
+    """Copy the preset template into tmp_path and point config lookups at it.
+
+    Returns:
+        The config directory (its "agents" subdirectory holds the presets)
+    """
+    shutil.copytree(preset_template_dir, tmp_path, dirs_exist_ok=True)
+    config_dir = tmp_path / "config"
+    agents_dir = config_dir / "agents"
+    monkeypatch.setattr("focusgroup.config.get_default_config_dir", lambda: config_dir)
+    monkeypatch.setattr("focusgroup.config.get_agents_dir", lambda: agents_dir)
+    return config_dir
+
+
+# Commands whose --help output is rendered once and shared across tests
+HELP_COMMANDS: list[tuple[str, ...]] = [
+    (),
+    ("agents", "list"),
+    ("logs", "list"),
+    ("ask",),
+    ("init",),
+    ("doctor",),
+    ("demo",),
 ]
 
-[output]
-format = "json"
-"""
-        config_file = tmp_path / "session.toml"
-        config_file.write_text(config_content)
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """A single CliRunner shared by every test; stdout and stderr are kept separate."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def help_outputs(runner: CliRunner) -> dict[tuple[str, ...], str]:
+    """Render --help once per command and cache the output for the session.
+
+    Help rendering has no side effects and its output is deterministic for
+    a given app, so tests can share a single invocation per command.
+    """
+    outputs = {}
+    for command in HELP_COMMANDS:
+        result = runner.invoke(app, [*command, "--help"])
+        assert result.exit_code == 0, result.stderr
+        outputs[command] = result.stdout
+    return outputs
+
+
+@pytest.fixture
+def mock_asyncio_run(monkeypatch) -> MagicMock:
+    """Replace asyncio.run in the CLI module so commands never start an event loop."""
+    mock_run = MagicMock(return_value=None)
+    monkeypatch.setattr("focusgroup.cli.asyncio.run", mock_run)
+    return mock_run
+
+
+@pytest.fixture
+def mock_ask_impl(monkeypatch) -> MagicMock:
+    """Replace _ask_impl and stub out context resolution for direct command calls."""
+    mock_impl = MagicMock()
+    monkeypatch.setattr("focusgroup.cli._ask_impl", mock_impl)
+    monkeypatch.setattr("focusgroup.cli.resolve_context", lambda context: "help output")
+    return mock_impl
+
+
+@pytest.fixture
+def mock_storage(monkeypatch) -> MagicMock:
+    """Replace the CLI's session storage with a MagicMock."""
+    storage = MagicMock()
+    monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: storage)
+    return storage
+
+
+@pytest.fixture(scope="session")
+def session_template() -> SessionLog:
+    """A minimal session log shared by the logs tests.
+
+    Tests needing variations should derive from it with ``model_copy(update=...)``
+    rather than mutating it.
+    """
+    return SessionLog(
+        id="test123",
+        tool="mx",
+        mode="single",
+        agent_count=1,
+        rounds=[],
+        created_at=_FIXED_NOW,
+    )
+
+
+@pytest.fixture
+def write_config(tmp_path: Path):
+    """Provide a helper that writes TOML config content and returns its path."""
+
+    def _write(content: str, name: str = "session.toml") -> Path:
+        path = tmp_path / name
+        path.write_text(content)
+        return path
+
+    return _write
+
+
+class TestMainApp:
+    """Test main CLI app."""
+
+    def test_help_shows_description(self, help_outputs):
+        """Help text shows application description."""
+        output = help_outputs[()]
+        assert "Gather feedback from multiple LLM agents" in output
+
+    @pytest.mark.parametrize(
+        ("command", "needle"),
+        [
+            pytest.param((), "--quiet", id="quiet-flag"),
+            pytest.param((), "Suppress status messages", id="quiet-documented"),
+            pytest.param(("ask",), "--verbose", id="ask-verbose-flag"),
+        ],
+    )
+    def test_help_documents_option(self, help_outputs, command: tuple[str, ...], needle: str):
+        """Global and per-command flags appear in their --help output."""
+        assert needle in help_outputs[command]
+
+    def test_version_flag(self, runner):
+        """--version flag shows version."""
+        result = runner.invoke(app, ["--version"])
+        assert result.exit_code == 0
+        assert "focusgroup" in result.stdout.lower()
+
+    def test_no_args_shows_help(self, runner):
+        """Running without args shows help (exit code 2 due to no_args_is_help)."""
+        result = runner.invoke(app, [])
+        output = result.stdout
+        # Typer with no_args_is_help=True returns exit code 0, but shows usage
+        # The help text should be shown regardless
+        assert "Usage:" in output or "Commands:" in output
+
+
+class TestRunCommand:
+    """Test 'run' command."""
+
+    def test_run_missing_config(self, runner, tmp_path: Path):
+        """Run with non-existent config shows error."""
+        result = runner.invoke(app, ["run", str(tmp_path / "missing.toml")])
+        assert result.exit_code == 1
+        assert "not found" in result.stdout.lower()
+
+    def test_run_invalid_config(self, runner, write_config):
+        """Run with invalid config shows error."""
+        bad_config = write_config("not valid toml = = =", "bad.toml")
+
+        result = runner.invoke(app, ["run", str(bad_config)])
+        assert result.exit_code == 1
+        assert "failed" in result.stdout.lower()
+
+    def test_run_dry_run(self, runner, write_config):
+        """Dry run shows session plan without executing."""
+        config_file = write_config(_DRY_RUN_CONFIG)
+
+        result = runner.invoke(app, ["run", str(config_file), "--dry-run"])
+
+        assert result.exit_code == 0
+        output = result.stdout
+        assert "Session Plan" in output
+        assert "mx" in output
+        assert "single" in output
+        assert "enabled" in output  # moderator
+        assert "Claude Expert" in output
+        assert "Codex Expert" in output
+        assert "How usable" in output
+        assert "2" in output  # Two questions
+
+    def test_run_dry_run_json_output(self, runner, write_config):
+        """Dry run with --json outputs parseable JSON."""
+        import json
+
+        config_file = write_config(_DRY_RUN_CONFIG)
 
         result = runner.invoke(app, ["run", str(config_file), "--dry-run", "--json"])
 
@@ -148,17 +289,14 @@ format = "json"
 class TestAgentsCommands:
     """Test 'agents' subcommand group."""
 
-    def test_agents_list_help(self):
+    def test_agents_list_help(self, help_outputs):
         """Agents list shows help."""
-        result = runner.invoke(app, ["agents", "list", "--help"])
-        assert result.exit_code == 0
-        assert "List available agent presets" in result.stdout
+        output = help_outputs[("agents", "list")]
+        assert "List available agent presets" in output
 
-    def test_agents_list_empty(self, monkeypatch, tmp_path: Path):
+    def test_agents_list_empty(self, runner, monkeypatch, preset_dir: Path):
         """Agents list shows message when no presets."""
-        agents_dir = tmp_path / "agents"
-        agents_dir.mkdir()
-        monkeypatch.setattr("focusgroup.cli.get_agents_dir", lambda: agents_dir)
+        monkeypatch.setattr("focusgroup.cli.get_agents_dir", lambda: preset_dir / "agents")
         monkeypatch.setattr("focusgroup.cli.list_agent_presets", lambda: [])
 
         result = runner.invoke(app, ["agents", "list"])
@@ -166,11 +304,9 @@ class TestAgentsCommands:
         assert result.exit_code == 0
         assert "No agent presets found" in result.stdout
 
-    def test_agents_show_not_found(self, monkeypatch, tmp_path: Path):
+    def test_agents_show_not_found(self, runner, monkeypatch, preset_dir: Path):
         """Agents show with non-existent preset shows error."""
-        agents_dir = tmp_path / "agents"
-        agents_dir.mkdir()
-        monkeypatch.setattr("focusgroup.cli.get_agents_dir", lambda: agents_dir)
+        monkeypatch.setattr("focusgroup.cli.get_agents_dir", lambda: preset_dir / "agents")
 
         result = runner.invoke(app, ["agents", "show", "nonexistent"])
 
@@ -181,69 +317,59 @@ class TestAgentsCommands:
 class TestLogsCommands:
     """Test 'logs' subcommand group."""
 
-    def test_logs_list_help(self):
+    def test_logs_list_help(self, help_outputs):
         """Logs list shows help."""
-        result = runner.invoke(app, ["logs", "list", "--help"])
-        assert result.exit_code == 0
-        assert "List past session logs" in result.stdout
+        output = help_outputs[("logs", "list")]
+        assert "List past session logs" in output
 
-    def test_logs_list_empty(self, monkeypatch):
+    def test_logs_list_empty(self, runner, mock_storage):
         """Logs list shows message when no sessions."""
-        mock_storage = MagicMock()
         mock_storage.list_sessions.return_value = []
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
 
         result = runner.invoke(app, ["logs", "list"])
 
         assert result.exit_code == 0
         assert "No sessions found" in result.stdout
 
-    def test_logs_list_with_sessions(self, monkeypatch):
+    def test_logs_list_with_sessions(self, runner, mock_storage, session_template):
         """Logs list shows table of sessions."""
-        mock_storage = MagicMock()
         mock_storage.list_sessions.return_value = [
-            SessionLog(
-                id="abc123",
-                tool="mx",
-                mode="single",
-                agent_count=2,
-                rounds=[QuestionRound(round_number=0, question="Test?")],
-                completed_at=datetime.now(),
+            session_template.model_copy(
+                update={
+                    "id": "abc123",
+                    "agent_count": 2,
+                    "rounds": [QuestionRound(round_number=0, question="Test?")],
+                    "completed_at": _FIXED_NOW + timedelta(minutes=5),
+                }
             ),
         ]
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
 
         result = runner.invoke(app, ["logs", "list"])
 
         assert result.exit_code == 0
-        assert "mx" in result.stdout
-        assert "single" in result.stdout
+        output = result.stdout
+        assert "mx" in output
+        assert "single" in output
 
-    def test_logs_list_with_limit(self, monkeypatch):
+    def test_logs_list_with_limit(self, runner, mock_storage):
         """Logs list respects --limit option."""
-        mock_storage = MagicMock()
         mock_storage.list_sessions.return_value = []
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
 
         runner.invoke(app, ["logs", "list", "--limit", "5"])
 
         mock_storage.list_sessions.assert_called_with(limit=5, tool_filter=None, tag_filter=None)
 
-    def test_logs_list_with_tool_filter(self, monkeypatch):
+    def test_logs_list_with_tool_filter(self, runner, mock_storage):
         """Logs list respects --tool option."""
-        mock_storage = MagicMock()
         mock_storage.list_sessions.return_value = []
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
 
         runner.invoke(app, ["logs", "list", "--tool", "mx"])
 
         mock_storage.list_sessions.assert_called_with(limit=10, tool_filter="mx", tag_filter=None)
 
-    def test_logs_list_with_tag_filter(self, monkeypatch):
+    def test_logs_list_with_tag_filter(self, runner, mock_storage):
         """Logs list respects --tag option."""
-        mock_storage = MagicMock()
         mock_storage.list_sessions.return_value = []
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
 
         runner.invoke(app, ["logs", "list", "--tag", "release-prep"])
 
@@ -251,111 +377,89 @@ class TestLogsCommands:
             limit=10, tool_filter=None, tag_filter="release-prep"
         )
 
-    def test_logs_show_not_found(self, monkeypatch):
+    def test_logs_show_not_found(self, runner, mock_storage):
         """Logs show with non-existent session shows error."""
-        mock_storage = MagicMock()
         mock_storage.load.side_effect = FileNotFoundError("Session not found")
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
 
         result = runner.invoke(app, ["logs", "show", "nonexistent"])
 
         assert result.exit_code == 1
         assert "not found" in result.stdout.lower()
 
-    def test_logs_show_displays_session(self, monkeypatch):
+    def test_logs_show_displays_session(self, runner, mock_storage, session_template):
         """Logs show displays session content."""
-        mock_storage = MagicMock()
-        mock_storage.load.return_value = SessionLog(
-            id="test123",
-            tool="mx",
-            mode="single",
-            agent_count=1,
-            rounds=[
-                QuestionRound(
-                    round_number=0,
-                    question="Test question?",
-                    responses=[
-                        AgentResponse(
-                            agent_name="Agent-1",
-                            provider="claude",
-                            prompt="Test question?",
-                            response="Test response",
-                        ),
-                    ],
-                ),
-            ],
+        mock_storage.load.return_value = session_template.model_copy(
+            update={
+                "rounds": [
+                    QuestionRound(
+                        round_number=0,
+                        question="Test question?",
+                        responses=[
+                            AgentResponse(
+                                agent_name="Agent-1",
+                                provider="claude",
+                                prompt="Test question?",
+                                response="Test response",
+                            ),
+                        ],
+                    ),
+                ]
+            }
         )
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
 
         result = runner.invoke(app, ["logs", "show", "test123"])
 
         assert result.exit_code == 0
-        assert "mx" in result.stdout
-        assert "Test question" in result.stdout or "Test response" in result.stdout
+        output = result.stdout
+        assert "mx" in output
+        assert "Test question" in output or "Test response" in output
 
-    def test_logs_show_json_format(self, monkeypatch):
+    def test_logs_show_json_format(self, runner, mock_storage, session_template):
         """Logs show with --format json outputs JSON."""
-        mock_storage = MagicMock()
-        mock_storage.load.return_value = SessionLog(
-            id="test123",
-            tool="mx",
-            mode="single",
-            agent_count=0,
-            rounds=[],
-        )
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
+        mock_storage.load.return_value = session_template.model_copy(update={"agent_count": 0})
 
         result = runner.invoke(app, ["logs", "show", "test123", "--format", "json"])
 
         assert result.exit_code == 0
+        output = result.stdout
         # Should be valid JSON structure
-        assert "tool" in result.stdout
-        assert "mx" in result.stdout
+        assert "tool" in output
+        assert "mx" in output
 
-    def test_logs_export_not_found(self, monkeypatch):
+    def test_logs_export_not_found(self, runner, mock_storage):
         """Logs export with non-existent session shows error."""
-        mock_storage = MagicMock()
         mock_storage.load.side_effect = FileNotFoundError("Session not found")
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
 
         result = runner.invoke(app, ["logs", "export", "nonexistent"])
 
         assert result.exit_code == 1
 
-    def test_logs_export_creates_file(self, monkeypatch, tmp_path: Path):
-        """Logs export creates output file."""
-        mock_storage = MagicMock()
-        mock_storage.load.return_value = SessionLog(
-            id="test123",
-            tool="mx",
-            mode="single",
-            agent_count=1,
-            rounds=[],
-        )
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
+    def test_logs_export_creates_file(self, runner, mock_storage, session_template, monkeypatch):
+        """Logs export writes the session through the requested formatter."""
+        mock_storage.load.return_value = session_template
+        mock_get_formatter = MagicMock()
+        monkeypatch.setattr("focusgroup.cli.get_formatter", mock_get_formatter)
 
-        output_file = tmp_path / "export.md"
-        result = runner.invoke(app, ["logs", "export", "test123", "--output", str(output_file)])
+        result = runner.invoke(app, ["logs", "export", "test123", "--output", "export.md"])
 
         assert result.exit_code == 0
-        assert output_file.exists()
         assert "Exported" in result.stdout
+        mock_get_formatter.assert_called_once_with("markdown")
+        mock_get_formatter.return_value.write.assert_called_once_with(
+            session_template, Path("export.md")
+        )
 
-    def test_logs_delete_not_found(self, monkeypatch):
+    def test_logs_delete_not_found(self, runner, mock_storage):
         """Logs delete with non-existent session shows error."""
-        mock_storage = MagicMock()
         mock_storage.load.side_effect = FileNotFoundError("Session not found")
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
 
         result = runner.invoke(app, ["logs", "delete", "nonexistent"])
 
         assert result.exit_code == 1
 
-    def test_logs_delete_cancelled(self, monkeypatch):
+    def test_logs_delete_cancelled(self, runner, mock_storage, session_template):
         """Logs delete cancellation works."""
-        mock_storage = MagicMock()
-        mock_storage.load.return_value = SessionLog(id="test123", tool="mx")
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
+        mock_storage.load.return_value = session_template
 
         # Simulate user typing 'n' to cancel
         result = runner.invoke(app, ["logs", "delete", "test123"], input="n\n")
@@ -364,12 +468,10 @@ class TestLogsCommands:
         assert "Cancelled" in result.stdout
         mock_storage.delete.assert_not_called()
 
-    def test_logs_delete_confirmed(self, monkeypatch):
+    def test_logs_delete_confirmed(self, runner, mock_storage, session_template):
         """Logs delete with confirmation works."""
-        mock_storage = MagicMock()
-        mock_storage.load.return_value = SessionLog(id="test123", tool="mx")
+        mock_storage.load.return_value = session_template
         mock_storage.delete.return_value = True
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
 
         # Simulate user typing 'y' to confirm
         result = runner.invoke(app, ["logs", "delete", "test123"], input="y\n")
@@ -378,12 +480,10 @@ class TestLogsCommands:
         assert "Deleted" in result.stdout
         mock_storage.delete.assert_called_once()
 
-    def test_logs_delete_force(self, monkeypatch):
+    def test_logs_delete_force(self, runner, mock_storage, session_template):
         """Logs delete with --force skips confirmation."""
-        mock_storage = MagicMock()
-        mock_storage.load.return_value = SessionLog(id="test123", tool="mx")
+        mock_storage.load.return_value = session_template
         mock_storage.delete.return_value = True
-        monkeypatch.setattr("focusgroup.cli.get_default_storage", lambda: mock_storage)
 
         result = runner.invoke(app, ["logs", "delete", "test123", "--force"])
 
@@ -395,14 +495,14 @@ class TestLogsCommands:
 class TestAskCommand:
     """Test 'ask' command."""
 
-    def test_ask_help(self):
+    def test_ask_help(self, help_outputs):
         """Ask command shows help."""
-        result = runner.invoke(app, ["ask", "--help"])
-        assert result.exit_code == 0
-        assert "Quick ad-hoc query" in result.stdout
+        output = help_outputs[("ask",)]
+        assert "Quick ad-hoc query" in output
 
-    def test_ask_invalid_provider(self):
+    def test_ask_invalid_provider(self, runner, monkeypatch):
         """Ask with invalid provider shows error."""
+        monkeypatch.setattr("focusgroup.cli.resolve_context", lambda context: "help output")
         result = runner.invoke(
             app,
             ["ask", "What's good?", "--context", "mx --help", "--provider", "invalid"],
@@ -410,53 +510,51 @@ class TestAskCommand:
         assert result.exit_code == 1
         assert "Unknown provider" in result.stdout
 
-    @patch("focusgroup.cli.asyncio.run")
-    def test_ask_invokes_async(self, mock_run):
+    @pytest.mark.slow
+    def test_ask_invokes_async(self, runner, mock_asyncio_run):
         """Ask command invokes async implementation."""
-        mock_run.return_value = None
         runner.invoke(app, ["ask", "What's good?", "--context", "echo test"])
 
         # Should have called asyncio.run with the async implementation
-        mock_run.assert_called_once()
+        mock_asyncio_run.assert_called_once()
 
-    def test_ask_requires_context(self):
+    def test_ask_requires_context(self, runner):
         """Ask command requires --context option."""
         result = runner.invoke(app, ["ask", "What's good?"])
         assert result.exit_code == 2
-        # Typer puts required option error in output (stdout or stderr combined)
-        assert "--context" in result.output
+        # Usage errors go to stderr only, leaving stdout clean
+        assert "Missing option '--context'" in result.stderr
+        assert result.stdout == ""
 
-    @patch("focusgroup.cli.asyncio.run")
-    def test_ask_infers_tool_from_command_context(self, mock_run):
+    def test_ask_infers_tool_from_command_context(self, mock_asyncio_run, mock_ask_impl):
         """Ask command infers tool name from command context."""
-        mock_run.return_value = None
-        result = runner.invoke(app, ["ask", "What's good?", "--context", "mytool --help"])
-        assert result.exit_code == 0
+
+        ask_cmd("What's good?", context="mytool --help")
+
+        mock_asyncio_run.assert_called_once()
         # The call should have used 'mytool' as the inferred tool name
-        mock_run.assert_called_once()
+        assert mock_ask_impl.call_args.args[0] == "mytool"
 
-    @patch("focusgroup.cli.asyncio.run")
-    def test_ask_tool_override(self, mock_run):
+    def test_ask_tool_override(self, mock_asyncio_run, mock_ask_impl):
         """Ask command allows explicit --tool override."""
-        mock_run.return_value = None
-        result = runner.invoke(
-            app,
-            ["ask", "What's good?", "--context", "mx --help", "--tool", "memex"],
-        )
-        assert result.exit_code == 0
-        mock_run.assert_called_once()
 
-    @patch("focusgroup.cli.asyncio.run")
-    def test_ask_reads_context_from_stdin(self, mock_run):
+        ask_cmd("What's good?", context="mx --help", tool="memex")
+
+        mock_asyncio_run.assert_called_once()
+        assert mock_ask_impl.call_args.args[0] == "memex"
+
+    def test_ask_reads_context_from_stdin(self, mock_asyncio_run, monkeypatch):
         """Ask command reads context from stdin when - is provided."""
-        mock_run.return_value = None
-        result = runner.invoke(
-            app,
-            ["ask", "Review this?", "--context", "-", "--tool", "myapi"],
-            input="This is content piped from stdin",
-        )
-        assert result.exit_code == 0
-        mock_run.assert_called_once()
+        mock_impl = MagicMock()
+        monkeypatch.setattr("focusgroup.cli._ask_impl", mock_impl)
+        monkeypatch.setattr("sys.stdin", io.StringIO("This is content piped from stdin"))
+
+        ask_cmd("Review this?", context="-", tool="myapi")
+
+        mock_asyncio_run.assert_called_once()
+        tool, _question, context = mock_impl.call_args.args[:3]
+        assert tool == "myapi"
+        assert context == "This is content piped from stdin"
 
 
 class TestInferToolFromContext:
@@ -493,58 +591,34 @@ class TestInferToolFromContext:
 class TestConfigValidation:
     """Test config validation through CLI."""
 
-    def test_config_missing_tool(self, tmp_path: Path):
-        """Config without tool section fails."""
-        config = tmp_path / "missing_tool.toml"
-        config.write_text("""
-[[agents]]
-provider = "claude"
-
-[questions]
-rounds = ["Test?"]
-""")
-        result = runner.invoke(app, ["run", str(config)])
-        assert result.exit_code == 1
-
-    def test_config_missing_agents(self, tmp_path: Path):
-        """Config without agents fails."""
-        config = tmp_path / "missing_agents.toml"
-        config.write_text("""
-[tool]
-command = "mx"
-
-[questions]
-rounds = ["Test?"]
-""")
-        result = runner.invoke(app, ["run", str(config)])
-        assert result.exit_code == 1
-
-    def test_config_missing_questions(self, tmp_path: Path):
-        """Config without questions fails."""
-        config = tmp_path / "missing_questions.toml"
-        config.write_text("""
-[tool]
-command = "mx"
-
-[[agents]]
-provider = "claude"
-""")
-        result = runner.invoke(app, ["run", str(config)])
-        assert result.exit_code == 1
-
-    def test_config_empty_questions(self, tmp_path: Path):
-        """Config with empty questions fails."""
-        config = tmp_path / "empty_questions.toml"
-        config.write_text("""
-[tool]
-command = "mx"
-
-[[agents]]
-provider = "claude"
-
-[questions]
-rounds = []
-""")
+    @pytest.mark.parametrize(
+        ("name", "toml_body"),
+        [
+            pytest.param(
+                "missing_tool.toml",
+                _CONFIG_MISSING_TOOL,
+                id="missing_tool",
+            ),
+            pytest.param(
+                "missing_agents.toml",
+                _CONFIG_MISSING_AGENTS,
+                id="missing_agents",
+            ),
+            pytest.param(
+                "missing_questions.toml",
+                _CONFIG_MISSING_QUESTIONS,
+                id="missing_questions",
+            ),
+            pytest.param(
+                "empty_questions.toml",
+                _CONFIG_EMPTY_QUESTIONS,
+                id="empty_questions",
+            ),
+        ],
+    )
+    def test_config_invalid(self, runner, write_config, name: str, toml_body: str):
+        """Configs missing required sections (or with empty questions) fail."""
+        config = write_config(toml_body, name)
         result = runner.invoke(app, ["run", str(config)])
         assert result.exit_code == 1
 
@@ -552,9 +626,11 @@ rounds = []
 class TestCliOutputFormats:
     """Test CLI output format handling."""
 
-    def test_dry_run_different_formats(self, tmp_path: Path):
+    @pytest.mark.parametrize("fmt", ["json", "markdown", "text"])
+    def test_dry_run_different_formats(self, runner, write_config, fmt: str):
         """Dry run works regardless of output format."""
-        config_content = """
+        config = write_config(
+            f"""
 [tool]
 command = "mx"
 
@@ -565,29 +641,24 @@ provider = "claude"
 rounds = ["Test?"]
 
 [output]
-format = "json"
-"""
-        config = tmp_path / "test.toml"
-        config.write_text(config_content)
-
-        for fmt in ["json", "markdown", "text"]:
-            config_content_fmt = config_content.replace('format = "json"', f'format = "{fmt}"')
-            config.write_text(config_content_fmt)
+format = "{fmt}"
+""",
+            "test.toml",
+        )
 
-            result = runner.invoke(app, ["run", str(config), "--dry-run"])
-            assert result.exit_code == 0, f"Failed for format: {fmt}"
+        result = runner.invoke(app, ["run", str(config), "--dry-run"])
+        assert result.exit_code == 0
 
 
 class TestInitCommand:
     """Test 'init' command."""
 
-    def test_init_help(self):
+    def test_init_help(self, help_outputs):
         """Init command shows help."""
-        result = runner.invoke(app, ["init", "--help"])
-        assert result.exit_code == 0
-        assert "Initialize a new focusgroup session config" in result.stdout
+        output = help_outputs[("init",)]
+        assert "Initialize a new focusgroup session config" in output
 
-    def test_init_quick_mode(self, tmp_path: Path, monkeypatch):
+    def test_init_quick_mode(self, runner, tmp_path: Path, monkeypatch):
         """Init with --quick creates config with defaults."""
         monkeypatch.chdir(tmp_path)
 
@@ -608,7 +679,7 @@ class TestInitCommand:
         assert len(config.agents) == 2
         assert len(config.questions.rounds) == 2
 
-    def test_init_quick_with_tool(self, tmp_path: Path, monkeypatch):
+    def test_init_quick_with_tool(self, runner, tmp_path: Path, monkeypatch):
         """Init with --quick and --tool uses custom tool name."""
         monkeypatch.chdir(tmp_path)
 
@@ -625,7 +696,7 @@ class TestInitCommand:
         config = load_config(config_file)
         assert config.tool.command == "mx"
 
-    def test_init_quick_with_provider(self, tmp_path: Path, monkeypatch):
+    def test_init_quick_with_provider(self, runner, tmp_path: Path, monkeypatch):
         """Init with --quick and --provider uses custom provider."""
         monkeypatch.chdir(tmp_path)
 
@@ -639,7 +710,7 @@ class TestInitCommand:
         config = load_config(config_file)
         assert all(agent.provider_name == "codex" for agent in config.agents)
 
-    def test_init_custom_output(self, tmp_path: Path, monkeypatch):
+    def test_init_custom_output(self, runner, tmp_path: Path, monkeypatch):
         """Init with --output creates config at custom path."""
         monkeypatch.chdir(tmp_path)
         custom_path = tmp_path / "custom" / "session.toml"
@@ -652,7 +723,7 @@ class TestInitCommand:
         assert result.exit_code == 0
         assert custom_path.exists()
 
-    def test_init_interactive_accepts_defaults(self, tmp_path: Path, monkeypatch):
+    def test_init_interactive_accepts_defaults(self, runner, tmp_path: Path, monkeypatch):
         """Init in interactive mode accepts default values."""
         monkeypatch.chdir(tmp_path)
 
@@ -669,7 +740,7 @@ class TestInitCommand:
         config_file = tmp_path / "focusgroup.toml"
         assert config_file.exists()
 
-    def test_init_overwrite_cancelled(self, tmp_path: Path, monkeypatch):
+    def test_init_overwrite_cancelled(self, runner, tmp_path: Path, monkeypatch):
         """Init cancels when file exists and user declines overwrite."""
         monkeypatch.chdir(tmp_path)
 
@@ -686,7 +757,7 @@ class TestInitCommand:
         # File should be unchanged
         assert "old" in existing.read_text()
 
-    def test_init_overwrite_confirmed(self, tmp_path: Path, monkeypatch):
+    def test_init_overwrite_confirmed(self, runner, tmp_path: Path, monkeypatch):
         """Init overwrites when file exists and user confirms."""
         monkeypatch.chdir(tmp_path)
 
@@ -705,7 +776,7 @@ class TestInitCommand:
         # File should be overwritten
         assert "old" not in existing.read_text()
 
-    def test_init_generates_valid_toml(self, tmp_path: Path, monkeypatch):
+    def test_init_generates_valid_toml(self, runner, tmp_path: Path, monkeypatch):
         """Init generates valid TOML that loads and validates."""
         monkeypatch.chdir(tmp_path)
 
@@ -733,7 +804,7 @@ class TestInitCommand:
         assert config.session.name == "myapp-feedback"
         assert config.tool.command == "myapp"
 
-    def test_init_quick_mode_no_overwrite_prompt(self, tmp_path: Path, monkeypatch):
+    def test_init_quick_mode_no_overwrite_prompt(self, runner, tmp_path: Path, monkeypatch):
         """Init with --quick doesn't prompt for overwrite, just overwrites."""
         monkeypatch.chdir(tmp_path)
 
@@ -756,86 +827,57 @@ class TestInitCommand:
 class TestDoctorCommand:
     """Test 'doctor' command."""
 
-    def test_doctor_help(self):
+    def test_doctor_help(self, help_outputs):
         """Doctor command shows help."""
-        result = runner.invoke(app, ["doctor", "--help"])
-        assert result.exit_code == 0
-        assert "Check focusgroup setup" in result.stdout
-
-    @patch("focusgroup.cli.subprocess.run")
-    def test_doctor_all_providers_installed(self, mock_run, tmp_path: Path, monkeypatch):
-        """Doctor shows success when all providers are installed."""
-        # Mock config directories
-        config_dir = tmp_path / "config"
-        agents_dir = config_dir / "agents"
-        config_dir.mkdir()
-        agents_dir.mkdir()
-        monkeypatch.setattr("focusgroup.config.get_default_config_dir", lambda: config_dir)
-        monkeypatch.setattr("focusgroup.config.get_agents_dir", lambda: agents_dir)
-
-        # Mock subprocess to return success for both CLIs
-        mock_run.return_value = CompletedProcess(
-            args=["test", "--version"],
-            returncode=0,
-            stdout="test-cli 1.0.0",
-            stderr="",
-        )
-
-        result = runner.invoke(app, ["doctor"])
+        output = help_outputs[("doctor",)]
+        assert "Check focusgroup setup" in output
+
+    @pytest.mark.parametrize(
+        ("outcomes", "expected"),
+        [
+            pytest.param(
+                {"claude": 0, "codex": 0},
+                ["All checks passed", "✓", "2 presets"],
+                id="all_installed",
+            ),
+            pytest.param(
+                {"claude": FileNotFoundError, "codex": FileNotFoundError},
+                ["Not installed", "✗", "Some providers are not installed", "Install:"],
+                id="all_missing",
+            ),
+            pytest.param(
+                {"claude": 0, "codex": FileNotFoundError},
+                ["✓", "✗", "Some providers are not installed"],
+                id="partial",
+            ),
+        ],
+    )
+    def test_doctor_provider_outcomes(
+        self, runner, monkeypatch, preset_dir: Path, outcomes: dict, expected: list[str]
+    ):
+        """Doctor reports each provider's install status without failing."""
 
-        assert result.exit_code == 0
-        assert "All checks passed" in result.stdout
-        assert "✓" in result.stdout
+        def run_side_effect(cmd, **kwargs):
+            outcome = outcomes[cmd[0]]
+            if isinstance(outcome, type) and issubclass(outcome, Exception):
+                raise outcome(f"{cmd[0]} not found")
+            return CompletedProcess(
+                args=cmd, returncode=outcome, stdout=f"{cmd[0]} 1.0.0", stderr=""
+            )
 
-    @patch("focusgroup.cli.subprocess.run")
-    def test_doctor_missing_provider(self, mock_run, tmp_path: Path, monkeypatch):
-        """Doctor shows error when a provider is not installed."""
-        # Mock config directories
-        config_dir = tmp_path / "config"
-        agents_dir = config_dir / "agents"
-        config_dir.mkdir()
-        agents_dir.mkdir()
-        monkeypatch.setattr("focusgroup.config.get_default_config_dir", lambda: config_dir)
-        monkeypatch.setattr("focusgroup.config.get_agents_dir", lambda: agents_dir)
-
-        # Mock subprocess to raise FileNotFoundError (CLI not found)
-        mock_run.side_effect = FileNotFoundError("Command not found")
+        monkeypatch.setattr("focusgroup.cli.subprocess.run", run_side_effect)
 
         result = runner.invoke(app, ["doctor"])
 
         assert result.exit_code == 0  # Doctor doesn't fail, just reports
-        assert "Not installed" in result.stdout
-        assert "✗" in result.stdout
-        assert "Some providers are not installed" in result.stdout
-
-    @patch("focusgroup.cli.subprocess.run")
-    def test_doctor_shows_install_instructions(self, mock_run, tmp_path: Path, monkeypatch):
-        """Doctor shows install instructions for missing providers."""
-        config_dir = tmp_path / "config"
-        agents_dir = config_dir / "agents"
-        config_dir.mkdir()
-        agents_dir.mkdir()
-        monkeypatch.setattr("focusgroup.config.get_default_config_dir", lambda: config_dir)
-        monkeypatch.setattr("focusgroup.config.get_agents_dir", lambda: agents_dir)
-
-        mock_run.side_effect = FileNotFoundError("Command not found")
-
-        result = runner.invoke(app, ["doctor"])
-
-        # Should show install instructions
-        assert "npm install" in result.stdout or "Install:" in result.stdout
+        output = result.stdout
+        for text in expected:
+            assert text in output
 
     @patch("focusgroup.cli.subprocess.run")
     @patch("focusgroup.cli.get_default_storage")
-    def test_doctor_verbose_mode(self, mock_storage_fn, mock_run, tmp_path: Path, monkeypatch):
+    def test_doctor_verbose_mode(self, mock_storage_fn, mock_run, runner, preset_dir: Path):
         """Doctor verbose mode shows additional info."""
-        config_dir = tmp_path / "config"
-        agents_dir = config_dir / "agents"
-        config_dir.mkdir()
-        agents_dir.mkdir()
-        monkeypatch.setattr("focusgroup.config.get_default_config_dir", lambda: config_dir)
-        monkeypatch.setattr("focusgroup.config.get_agents_dir", lambda: agents_dir)
-
         mock_run.return_value = CompletedProcess(
             args=["test", "--version"],
             returncode=0,
@@ -850,199 +892,105 @@ class TestDoctorCommand:
         result = runner.invoke(app, ["doctor", "--verbose"])
 
         assert result.exit_code == 0
-        assert "Auth:" in result.stdout
-        assert "Storage:" in result.stdout
-
-    @patch("focusgroup.cli.subprocess.run")
-    def test_doctor_shows_agent_preset_count(self, mock_run, tmp_path: Path, monkeypatch):
-        """Doctor shows count of agent presets."""
-        config_dir = tmp_path / "config"
-        agents_dir = config_dir / "agents"
-        config_dir.mkdir()
-        agents_dir.mkdir()
-
-        # Create some preset files
-        (agents_dir / "expert.toml").write_text('[agent]\nprovider = "claude"')
-        (agents_dir / "reviewer.toml").write_text('[agent]\nprovider = "codex"')
-
-        monkeypatch.setattr("focusgroup.config.get_default_config_dir", lambda: config_dir)
-        monkeypatch.setattr("focusgroup.config.get_agents_dir", lambda: agents_dir)
-
-        mock_run.return_value = CompletedProcess(
-            args=["test", "--version"],
-            returncode=0,
-            stdout="test-cli 1.0.0",
-            stderr="",
-        )
-
-        result = runner.invoke(app, ["doctor"])
-
-        assert result.exit_code == 0
-        assert "2 presets" in result.stdout
-
-    @patch("focusgroup.cli.subprocess.run")
-    def test_doctor_partial_provider_failure(self, mock_run, tmp_path: Path, monkeypatch):
-        """Doctor handles one provider installed, one missing."""
-        config_dir = tmp_path / "config"
-        agents_dir = config_dir / "agents"
-        config_dir.mkdir()
-        agents_dir.mkdir()
-        monkeypatch.setattr("focusgroup.config.get_default_config_dir", lambda: config_dir)
-        monkeypatch.setattr("focusgroup.config.get_agents_dir", lambda: agents_dir)
-
-        # First call succeeds (claude), second fails (codex)
-        def run_side_effect(cmd, **kwargs):
-            if cmd[0] == "claude":
-                return CompletedProcess(args=cmd, returncode=0, stdout="claude 1.0.0", stderr="")
-            else:
-                raise FileNotFoundError("codex not found")
-
-        mock_run.side_effect = run_side_effect
-
-        result = runner.invoke(app, ["doctor"])
-
-        assert result.exit_code == 0
-        # Should have both success and failure indicators
-        assert "✓" in result.stdout  # claude succeeded
-        assert "✗" in result.stdout  # codex failed
-        assert "Some providers are not installed" in result.stdout
+        output = result.stdout
+        assert "Auth:" in output
+        assert "Storage:" in output
 
 
 class TestDemoCommand:
     """Test 'demo' command."""
 
-    def test_demo_help(self):
+    def test_demo_help(self, help_outputs):
         """Demo command shows help."""
-        result = runner.invoke(app, ["demo", "--help"])
-        assert result.exit_code == 0
-        assert "self-referential demo" in result.stdout.lower()
-        assert "--provider" in result.stdout
-        assert "--question" in result.stdout
+        output = help_outputs[("demo",)]
+        assert "self-referential demo" in output.lower()
+        assert "--provider" in output
+        assert "--question" in output
 
-    @patch("focusgroup.cli.asyncio.run")
-    def test_demo_invokes_ask(self, mock_run):
+    def test_demo_invokes_ask(self, mock_asyncio_run, mock_ask_impl, capsys):
         """Demo command invokes the ask implementation."""
-        mock_run.return_value = None
-        result = runner.invoke(app, ["demo", "--yes"])
+        demo_cmd(yes=True)
 
-        assert result.exit_code == 0
-        assert "Demo" in result.stdout
-        mock_run.assert_called_once()
+        assert "Demo" in capsys.readouterr().out
+        mock_asyncio_run.assert_called_once()
+        assert mock_ask_impl.call_args.kwargs["tool"] == "focusgroup"
+        assert mock_ask_impl.call_args.kwargs["tags"] == ["demo"]
 
-    @patch("focusgroup.cli.asyncio.run")
-    def test_demo_custom_question(self, mock_run):
+    def test_demo_custom_question(self, mock_asyncio_run, mock_ask_impl):
         """Demo accepts custom question."""
-        mock_run.return_value = None
-        result = runner.invoke(
-            app,
-            ["demo", "--question", "What is best?", "--yes"],
-        )
+        demo_cmd(question="What is best?", yes=True)
 
-        assert result.exit_code == 0
-        mock_run.assert_called_once()
+        mock_asyncio_run.assert_called_once()
+        assert mock_ask_impl.call_args.kwargs["question"] == "What is best?"
 
-    @patch("focusgroup.cli.asyncio.run")
-    def test_demo_custom_provider(self, mock_run):
+    def test_demo_custom_provider(self, mock_asyncio_run, mock_ask_impl):
         """Demo accepts custom provider."""
-        mock_run.return_value = None
-        result = runner.invoke(app, ["demo", "--provider", "codex", "--yes"])
+        demo_cmd(provider="codex", yes=True)
 
-        assert result.exit_code == 0
-        mock_run.assert_called_once()
+        mock_asyncio_run.assert_called_once()
+        assert mock_ask_impl.call_args.kwargs["provider_str"] == "codex"
 
 
 class TestCostWarning:
     """Test cost warning and --yes flag."""
 
-    @patch("focusgroup.cli.asyncio.run")
-    def test_ask_with_yes_flag_skips_prompt(self, mock_run):
-        """Ask with --yes skips cost confirmation."""
-        mock_run.return_value = None
-        # High agent count would normally trigger confirmation
-        result = runner.invoke(
-            app,
-            [
-                "ask",
-                "Test?",
-                "--context",
-                "echo test",
-                "--agents",
-                "10",
-                "--yes",
-            ],
-        )
-        assert result.exit_code == 0
-        mock_run.assert_called_once()
+    @pytest.mark.parametrize("yes", [True, False], ids=["yes", "prompt"])
+    def test_ask_high_cost_confirmation(self, mock_asyncio_run, mock_ask_impl, monkeypatch, yes):
+        """High-cost asks prompt for confirmation unless --yes is given."""
+        mock_confirm = MagicMock(return_value=True)
+        monkeypatch.setattr("focusgroup.cli.typer.confirm", mock_confirm)
+
+        # Ten exploring agents cross CONFIRM_THRESHOLD
+        ask_cmd("Test?", context="echo test", agents=10, explore=True, yes=yes)
+
+        assert mock_confirm.called is not yes
+        mock_asyncio_run.assert_called_once()
 
-    @patch("focusgroup.cli.asyncio.run")
-    def test_ask_low_cost_no_confirmation(self, mock_run):
+    def test_ask_low_cost_no_confirmation(self, mock_asyncio_run, mock_ask_impl, monkeypatch):
         """Ask with low cost doesn't require confirmation."""
-        mock_run.return_value = None
+        mock_confirm = MagicMock()
+        monkeypatch.setattr("focusgroup.cli.typer.confirm", mock_confirm)
+
         # Single agent, no exploration - should be below threshold
-        result = runner.invoke(
-            app,
-            ["ask", "Test?", "--context", "echo test", "--agents", "1"],
-        )
-        assert result.exit_code == 0
-        mock_run.assert_called_once()
+        ask_cmd("Test?", context="echo test", agents=1)
+
+        mock_confirm.assert_not_called()
+        mock_asyncio_run.assert_called_once()
 
 
 class TestVerboseFlag:
     """Test --verbose flag on ask command."""
 
-    def test_ask_accepts_verbose_flag(self):
-        """Ask command accepts --verbose flag."""
-        result = runner.invoke(app, ["ask", "--help"])
-        assert "--verbose" in result.stdout or "-v" in result.stdout
-
-    @patch("focusgroup.cli.asyncio.run")
-    def test_ask_verbose_runs_successfully(self, mock_run):
+    def test_ask_verbose_runs_successfully(self, mock_asyncio_run, mock_ask_impl):
         """Ask with --verbose runs successfully."""
-        mock_run.return_value = None
-        result = runner.invoke(
-            app,
-            ["ask", "Test?", "--context", "echo test", "--verbose"],
-        )
-        assert result.exit_code == 0
-        mock_run.assert_called_once()
+        ask_cmd("Test?", context="echo test", verbose=True)
+
+        mock_asyncio_run.assert_called_once()
+        assert mock_ask_impl.call_args.kwargs["verbose"] is True
 
 
 class TestQuietFlag:
     """Test --quiet flag for suppressing status messages."""
 
-    def test_main_app_accepts_quiet_flag(self):
-        """Main app accepts --quiet flag in help."""
-        result = runner.invoke(app, ["--help"])
-        assert "--quiet" in result.stdout or "-q" in result.stdout
-
-    def test_quiet_flag_documented(self):
-        """Quiet flag is properly documented."""
-        result = runner.invoke(app, ["--help"])
-        has_suppress = "Suppress status messages" in result.stdout
-        has_clean = "JSON is always clean" in result.stdout
-        assert has_suppress or has_clean
-
-    @patch("focusgroup.cli.asyncio.run")
-    def test_ask_with_quiet_flag_runs(self, mock_run):
+    @pytest.mark.slow
+    def test_ask_with_quiet_flag_runs(self, runner, mock_asyncio_run):
         """Ask command runs with --quiet flag."""
-        mock_run.return_value = None
         result = runner.invoke(
             app,
             ["--quiet", "ask", "Test?", "--context", "echo test"],
         )
         assert result.exit_code == 0
-        mock_run.assert_called_once()
+        mock_asyncio_run.assert_called_once()
 
-    @patch("focusgroup.cli.asyncio.run")
-    def test_ask_with_short_quiet_flag_runs(self, mock_run):
+    @pytest.mark.slow
+    def test_ask_with_short_quiet_flag_runs(self, runner, mock_asyncio_run):
         """Ask command runs with -q short flag."""
-        mock_run.return_value = None
         result = runner.invoke(
             app,
             ["-q", "ask", "Test?", "--context", "echo test"],
         )
         assert result.exit_code == 0
-        mock_run.assert_called_once()
+        mock_asyncio_run.assert_called_once()
 
 
 class TestStatusPrint:
@@ -1050,57 +998,33 @@ class TestStatusPrint:
 
     def test_status_print_suppressed_for_json(self):
         """status_print is suppressed when is_json_output=True."""
-        from unittest.mock import patch
-
-        from focusgroup.cli import status_print
-
         # When is_json_output=True, nothing should be printed
         with patch("focusgroup.cli.stderr_console") as mock_console:
             status_print("Test message", is_json_output=True)
             mock_console.print.assert_not_called()
 
-    def test_status_print_shows_in_normal_mode(self):
+    def test_status_print_shows_in_normal_mode(self, monkeypatch):
         """status_print shows messages in normal mode."""
-        from unittest.mock import patch
-
         # Need to reset _quiet_mode for this test
-        import focusgroup.cli
-
-        original_quiet = focusgroup.cli._quiet_mode
-        focusgroup.cli._quiet_mode = False
+        monkeypatch.setattr(cli_mod, "_quiet_mode", False)
 
-        try:
-            with patch("focusgroup.cli.stderr_console") as mock_console:
-                from focusgroup.cli import status_print
-
-                status_print("Test message", is_json_output=False)
-                mock_console.print.assert_called_once_with("Test message")
-        finally:
-            focusgroup.cli._quiet_mode = original_quiet
+        with patch("focusgroup.cli.stderr_console") as mock_console:
+            status_print("Test message", is_json_output=False)
+            mock_console.print.assert_called_once_with("Test message")
 
-    def test_status_print_suppressed_in_quiet_mode(self):
+    def test_status_print_suppressed_in_quiet_mode(self, monkeypatch):
         """status_print is suppressed when _quiet_mode=True."""
-        from unittest.mock import patch
+        monkeypatch.setattr(cli_mod, "_quiet_mode", True)
 
-        import focusgroup.cli
-
-        original_quiet = focusgroup.cli._quiet_mode
-        focusgroup.cli._quiet_mode = True
-
-        try:
-            with patch("focusgroup.cli.stderr_console") as mock_console:
-                from focusgroup.cli import status_print
-
-                status_print("Test message", is_json_output=False)
-                mock_console.print.assert_not_called()
-        finally:
-            focusgroup.cli._quiet_mode = original_quiet
+        with patch("focusgroup.cli.stderr_console") as mock_console:
+            status_print("Test message", is_json_output=False)
+            mock_console.print.assert_not_called()
 
 
 class TestJsonOutputClean:
     """Test that JSON output is machine-parseable without pollution."""
 
-    def test_dry_run_json_is_valid(self, tmp_path: Path):
+    def test_dry_run_json_is_valid(self, runner, tmp_path: Path):
         """Dry run with JSON output produces valid JSON."""
         import json
 
@@ -1137,34 +1061,15 @@ format = "json"
             # Print the output for debugging
             raise AssertionError(f"Output is not valid JSON: {output!r}") from e
 
-    def test_logs_show_json_is_valid(self, tmp_path: Path):
+    def test_logs_show_json_is_valid(self, runner, mock_storage, session_template):
         """Logs show --json produces valid JSON without status messages."""
         import json
 
-        from focusgroup.storage.session_log import SessionLog, SessionStorage
+        mock_storage.load.return_value = session_template.model_copy(update={"tool": "testtool"})
 
-        # Create a session to show
-        storage = SessionStorage(tmp_path)
-        session = SessionLog(
-            tool="testtool",
-            mode="single",
-            agent_count=1,
-            rounds=[],
-        )
-        storage.save(session)
+        result = runner.invoke(app, ["logs", "show", "test123", "--json"])
 
-        result = runner.invoke(
-            app,
-            ["logs", "show", session.display_id, "--json"],
-            env={"FOCUSGROUP_LOG_DIR": str(tmp_path)},
-        )
-
-        # Try to parse as JSON - should not fail due to "Session saved:" message
-        output = result.stdout.strip()
-        try:
-            # The output should be parseable JSON
-            json.loads(output)
-        except json.JSONDecodeError:
-            # If it fails, check if it's due to a status message polluting output
-            assert "Session saved" not in output, "Status message polluted JSON output"
-            assert "Session log" not in output, "Status message polluted JSON output"
+        # Should parse cleanly - no "Session saved:" style status messages in stdout
+        assert result.exit_code == 0
+        parsed = json.loads(result.stdout)
+        assert parsed["tool"] == "testtool"
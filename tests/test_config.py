@@ -1,11 +1,13 @@
 """Unit tests for configuration loading and validation."""
 
+import re
 import tomllib
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
 
+import focusgroup.config as config_mod
 from focusgroup.config import (
     AgentConfig,
     AgentProvider,
@@ -24,23 +26,128 @@ from focusgroup.config import (
     list_agent_presets,
     list_schema_presets,
     load_agent_preset,
+    load_agent_preset_from_dict,
     load_config,
+    load_config_str,
 )
 
+# TOML bodies used by the loader tests
+
+_VALID_CONFIG_TOML = """
+[session]
+name = "Test Session"
+mode = "single"
+
+[tool]
+command = "mx"
+
+[[agents]]
+provider = "claude"
+model = "claude-sonnet-4-20250514"
+
+[questions]
+rounds = ["How usable is this CLI?", "What would you improve?"]
+
+[output]
+format = "json"
+"""
+
+_EXPECTED_VALID_CONFIG = FocusgroupConfig.model_construct(
+    session=SessionConfig.model_construct(name="Test Session", mode=SessionMode.SINGLE),
+    tool=ToolConfig.model_construct(command="mx"),
+    agents=[
+        AgentConfig.model_construct(provider=AgentProvider.CLAUDE, model="claude-sonnet-4-20250514")
+    ],
+    questions=QuestionsConfig.model_construct(
+        rounds=["How usable is this CLI?", "What would you improve?"]
+    ),
+    output=OutputConfig.model_construct(format="json"),
+)
+
+_MULTI_AGENT_CONFIG_TOML = """
+[tool]
+command = "beads"
+
+[[agents]]
+provider = "claude"
+name = "Claude Expert"
+
+[[agents]]
+provider = "codex"
+model = "o3-mini"
+
+[questions]
+rounds = ["Evaluate this tool"]
+"""
+
+_MISSING_TOOL_CONFIG_TOML = """
+[session]
+name = "Missing tool"
+
+[questions]
+rounds = ["Question?"]
+"""
+
+_WRAPPED_PRESET_TOML = b"""
+[agent]
+provider = "claude"
+model = "claude-sonnet-4-20250514"
+name = "Sonnet Expert"
+system_prompt = "You are a CLI tool expert."
+"""
+
+# Expected validation error messages
+_EMPTY_COMMAND_RE = re.compile("Command cannot be empty")
+_NO_QUESTIONS_RE = re.compile("At least one question")
+_INVALID_IDENTIFIER_RE = re.compile("valid identifier")
+
+
+@pytest.fixture(scope="session")
+def valid_config() -> FocusgroupConfig:
+    """Parse a complete single-agent config once for the session."""
+    return load_config_str(_VALID_CONFIG_TOML)
+
+
+@pytest.fixture(scope="session")
+def multi_agent_config() -> FocusgroupConfig:
+    """Parse a two-agent config once for the session."""
+    return load_config_str(_MULTI_AGENT_CONFIG_TOML)
+
+
+@pytest.fixture
+def fake_home(monkeypatch, tmp_path: Path) -> Path:
+    """Point Path.home() at a temp dir so config dir helpers don't touch the real home."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def agents_dir(monkeypatch, tmp_path: Path) -> Path:
+    """An empty user agents directory, with bundled presets disabled."""
+    agents_dir = tmp_path / "agents"
+    agents_dir.mkdir()
+    monkeypatch.setattr(config_mod, "get_agents_dir", lambda: agents_dir)
+    # Disable bundled presets to test user presets in isolation
+    monkeypatch.setattr(config_mod, "_get_bundled_presets", lambda: {})
+    return agents_dir
+
 
 class TestEnums:
     """Test configuration enums."""
 
-    def test_session_mode_values(self):
-        """Session modes should have expected values."""
-        assert SessionMode.SINGLE.value == "single"
-        assert SessionMode.DISCUSSION.value == "discussion"
-        assert SessionMode.STRUCTURED.value == "structured"
-
-    def test_agent_provider_values(self):
-        """Agent providers should have expected values."""
-        assert AgentProvider.CLAUDE.value == "claude"
-        assert AgentProvider.CODEX.value == "codex"
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (SessionMode.SINGLE, "single"),
+            (SessionMode.DISCUSSION, "discussion"),
+            (SessionMode.STRUCTURED, "structured"),
+            (AgentProvider.CLAUDE, "claude"),
+            (AgentProvider.CODEX, "codex"),
+        ],
+    )
+    def test_enum_values(self, member, expected: str):
+        """Session modes and agent providers should have expected values."""
+        assert member.value == expected
 
 
 class TestAgentConfig:
@@ -66,20 +173,26 @@ class TestAgentConfig:
         assert config.model == "o3-mini"
         assert config.name == "Codex Expert"
 
-    def test_display_name_with_custom_name(self):
-        """Display name should use custom name when set."""
-        config = AgentConfig(provider=AgentProvider.CLAUDE, name="Custom Agent")
-        assert config.display_name == "Custom Agent"
-
-    def test_display_name_with_model(self):
-        """Display name should combine provider:model when no custom name."""
-        config = AgentConfig(provider=AgentProvider.CLAUDE, model="opus")
-        assert config.display_name == "claude:opus"
-
-    def test_display_name_provider_only(self):
-        """Display name should fall back to provider."""
-        config = AgentConfig(provider=AgentProvider.CODEX)
-        assert config.display_name == "codex"
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param(
+                {"provider": AgentProvider.CLAUDE, "name": "Custom Agent"},
+                "Custom Agent",
+                id="custom_name",
+            ),
+            pytest.param(
+                {"provider": AgentProvider.CLAUDE, "model": "opus"},
+                "claude:opus",
+                id="provider_model",
+            ),
+            pytest.param({"provider": AgentProvider.CODEX}, "codex", id="provider_only"),
+        ],
+    )
+    def test_display_name(self, kwargs: dict, expected: str):
+        """Display name prefers custom name, then provider:model, then provider."""
+        config = AgentConfig(**kwargs)
+        assert config.display_name == expected
 
 
 class TestToolConfig:
@@ -99,16 +212,6 @@ class TestToolConfig:
         assert config.type == "docs"
         assert config.command == "./README.md"
 
-    def test_empty_command_rejected(self):
-        """Empty command should raise validation error."""
-        with pytest.raises(ValueError, match="Command cannot be empty"):
-            ToolConfig(command="")
-
-    def test_whitespace_command_rejected(self):
-        """Whitespace-only command should raise validation error."""
-        with pytest.raises(ValueError, match="Command cannot be empty"):
-            ToolConfig(command="   ")
-
     def test_command_whitespace_stripped(self):
         """Command with surrounding whitespace should be stripped."""
         config = ToolConfig(command="  mx  ")
@@ -130,11 +233,6 @@ class TestQuestionsConfig:
         config = QuestionsConfig(rounds=questions)
         assert len(config.rounds) == 3
 
-    def test_empty_rounds_rejected(self):
-        """Empty rounds list should raise validation error."""
-        with pytest.raises(ValueError, match="At least one question"):
-            QuestionsConfig(rounds=[])
-
 
 class TestSessionConfig:
     """Test SessionConfig model."""
@@ -191,103 +289,84 @@ class TestFocusgroupConfig:
         assert len(config.agents) == 1
         assert config.session.mode == SessionMode.SINGLE  # default
 
-    def test_empty_agents_rejected(self):
-        """Config with no agents should fail validation."""
-        # Pydantic raises ValidationError due to min_length=1 constraint
-        with pytest.raises(ValidationError):
-            FocusgroupConfig(
-                tool=ToolConfig(command="mx"),
-                agents=[],
-                questions=QuestionsConfig(rounds=["Question?"]),
-            )
+
+class TestValidationErrors:
+    """Test that invalid model values are rejected."""
+
+    @pytest.mark.parametrize(
+        ("factory", "match"),
+        [
+            pytest.param(lambda: ToolConfig(command=""), _EMPTY_COMMAND_RE, id="empty_command"),
+            pytest.param(
+                lambda: ToolConfig(command="   "),
+                _EMPTY_COMMAND_RE,
+                id="whitespace_command",
+            ),
+            pytest.param(lambda: QuestionsConfig(rounds=[]), _NO_QUESTIONS_RE, id="empty_rounds"),
+            # Pydantic's min_length=1 constraint rejects an empty agents list
+            pytest.param(
+                lambda: FocusgroupConfig(
+                    tool=ToolConfig(command="mx"),
+                    agents=[],
+                    questions=QuestionsConfig(rounds=["Question?"]),
+                ),
+                None,
+                id="empty_agents",
+            ),
+        ],
+    )
+    def test_validation_errors(self, factory, match: re.Pattern[str] | None):
+        """Invalid values raise ValidationError with a helpful message."""
+        with pytest.raises(ValidationError, match=match):
+            factory()
 
 
 class TestLoadConfig:
     """Test TOML config file loading."""
 
-    def test_load_valid_config(self, tmp_path: Path):
+    def test_load_valid_config(self, valid_config: FocusgroupConfig):
         """Load a valid TOML config file."""
-        config_content = """
-[session]
-name = "Test Session"
-mode = "single"
-
-[tool]
-command = "mx"
+        # Spot checks first so a mismatch points at the likely culprit
+        assert valid_config.tool.command == "mx"
+        assert valid_config.agents[0].provider == AgentProvider.CLAUDE
+        assert valid_config == _EXPECTED_VALID_CONFIG
 
-[[agents]]
-provider = "claude"
-model = "claude-sonnet-4-20250514"
-
-[questions]
-rounds = ["How usable is this CLI?", "What would you improve?"]
-
-[output]
-format = "json"
-"""
-        config_file = tmp_path / "test.toml"
-        config_file.write_text(config_content)
-
-        config = load_config(config_file)
-        assert config.session.name == "Test Session"
-        assert config.tool.command == "mx"
-        assert len(config.agents) == 1
-        assert config.agents[0].provider == AgentProvider.CLAUDE
-        assert len(config.questions.rounds) == 2
-        assert config.output.format == "json"
-
-    def test_load_config_multiple_agents(self, tmp_path: Path):
+    def test_load_config_multiple_agents(self, multi_agent_config: FocusgroupConfig):
         """Load config with multiple agents."""
-        config_content = """
-[tool]
-command = "beads"
-
-[[agents]]
-provider = "claude"
-name = "Claude Expert"
-
-[[agents]]
-provider = "codex"
-model = "o3-mini"
-
-[questions]
-rounds = ["Evaluate this tool"]
-"""
-        config_file = tmp_path / "multi.toml"
-        config_file.write_text(config_content)
-
-        config = load_config(config_file)
+        config = multi_agent_config
         assert len(config.agents) == 2
         assert config.agents[0].name == "Claude Expert"
         assert config.agents[1].model == "o3-mini"
 
+    def test_load_config_file_matches_string(self, valid_config: FocusgroupConfig, tmp_path: Path):
+        """Loading from a file gives the same config as loading the same TOML text."""
+        config_file = tmp_path / "test.toml"
+        config_file.write_text(_VALID_CONFIG_TOML)
+
+        assert load_config(config_file) == valid_config
+
     def test_load_config_file_not_found(self, tmp_path: Path):
         """Loading non-existent file should raise FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             load_config(tmp_path / "nonexistent.toml")
 
-    def test_load_config_invalid_toml(self, tmp_path: Path):
+    def test_load_config_invalid_toml(self):
         """Loading malformed TOML should raise error."""
-        config_file = tmp_path / "bad.toml"
-        config_file.write_text("this is not valid = = toml")
+        with pytest.raises(tomllib.TOMLDecodeError):
+            load_config_str("this is not valid = = toml")
+
+    def test_load_config_rejects_bare_carriage_return(self, tmp_path: Path):
+        """File bytes reach the TOML parser without newline translation."""
+        config_file = tmp_path / "cr.toml"
+        config_file.write_bytes(b'[tool]\rcommand = "mx"\n')
 
         with pytest.raises(tomllib.TOMLDecodeError):
             load_config(config_file)
 
-    def test_load_config_missing_required_field(self, tmp_path: Path):
+    def test_load_config_missing_required_field(self):
         """Config missing required fields should fail validation."""
-        config_content = """
-[session]
-name = "Missing tool"
-
-[questions]
-rounds = ["Question?"]
-"""
-        config_file = tmp_path / "incomplete.toml"
-        config_file.write_text(config_content)
-
         with pytest.raises(ValidationError):
-            load_config(config_file)
+            load_config_str(_MISSING_TOOL_CONFIG_TOML)
 
 
 class TestAgentPresets:
@@ -295,15 +374,8 @@ class TestAgentPresets:
 
     def test_load_agent_preset(self, tmp_path: Path):
         """Load an agent preset file."""
-        preset_content = """
-[agent]
-provider = "claude"
-model = "claude-sonnet-4-20250514"
-name = "Sonnet Expert"
-system_prompt = "You are a CLI tool expert."
-"""
         preset_file = tmp_path / "sonnet.toml"
-        preset_file.write_text(preset_content)
+        preset_file.write_bytes(_WRAPPED_PRESET_TOML)
 
         preset = load_agent_preset(preset_file)
         assert preset.provider == AgentProvider.CLAUDE
@@ -311,16 +383,9 @@ system_prompt = "You are a CLI tool expert."
         assert preset.name == "Sonnet Expert"
         assert "CLI tool expert" in preset.system_prompt
 
-    def test_load_agent_preset_without_wrapper(self, tmp_path: Path):
+    def test_load_agent_preset_without_wrapper(self):
         """Load preset without [agent] wrapper."""
-        preset_content = """
-provider = "codex"
-model = "o3-mini"
-"""
-        preset_file = tmp_path / "codex.toml"
-        preset_file.write_text(preset_content)
-
-        preset = load_agent_preset(preset_file)
+        preset = load_agent_preset_from_dict({"provider": "codex", "model": "o3-mini"})
         assert preset.provider == AgentProvider.CODEX
         assert preset.model == "o3-mini"
 
@@ -328,49 +393,51 @@ model = "o3-mini"
 class TestConfigDirectories:
     """Test config directory utilities."""
 
-    def test_get_default_config_dir(self):
+    def test_get_default_config_dir(self, fake_home: Path):
         """Default config dir should be under home."""
         config_dir = get_default_config_dir()
         assert config_dir.is_dir()
-        assert "focusgroup" in str(config_dir)
+        assert config_dir == fake_home / ".config" / "focusgroup"
 
-    def test_get_agents_dir(self):
+    def test_get_agents_dir(self, fake_home: Path):
         """Agents dir should be under config dir."""
         agents_dir = get_agents_dir()
         assert agents_dir.is_dir()
-        assert "agents" in str(agents_dir)
+        assert agents_dir == fake_home / ".config" / "focusgroup" / "agents"
 
-    def test_list_agent_presets_empty(self, monkeypatch, tmp_path: Path):
+    def test_list_agent_presets_empty(self, agents_dir: Path):
         """List presets returns empty when none exist (with bundled disabled)."""
-        agents_dir = tmp_path / "agents"
-        agents_dir.mkdir()
-        monkeypatch.setattr("focusgroup.config.get_agents_dir", lambda: agents_dir)
-        # Disable bundled presets to test user presets in isolation
-        monkeypatch.setattr("focusgroup.config._get_bundled_presets", lambda: {})
-
         presets = list_agent_presets()
         assert presets == []
 
-    def test_list_agent_presets(self, monkeypatch, tmp_path: Path):
+    def test_list_agent_presets(self, agents_dir: Path):
         """List presets returns available presets."""
-        agents_dir = tmp_path / "agents"
-        agents_dir.mkdir()
-
         # Create some preset files
-        (agents_dir / "claude.toml").write_text('provider = "claude"')
-        (agents_dir / "codex.toml").write_text('provider = "codex"')
-        (agents_dir / "not_toml.txt").write_text("ignored")
-
-        monkeypatch.setattr("focusgroup.config.get_agents_dir", lambda: agents_dir)
-        # Disable bundled presets to test user presets in isolation
-        monkeypatch.setattr("focusgroup.config._get_bundled_presets", lambda: {})
+        (agents_dir / "claude.toml").write_bytes(b'provider = "claude"')
+        (agents_dir / "codex.toml").write_bytes(b'provider = "codex"')
+        (agents_dir / "not_toml.txt").write_bytes(b"ignored")
 
         presets = list_agent_presets()
-        names = [name for name, _ in presets]
+        names = {name for name, _ in presets}
         assert len(presets) == 2
         assert "claude" in names
         assert "codex" in names
 
+    def test_user_preset_override_does_not_leak_into_bundled(self, monkeypatch, tmp_path: Path):
+        """Overriding a bundled preset doesn't modify the cached bundled mapping."""
+        bundled = config_mod._get_bundled_presets()
+        assert "claude-default" in bundled
+        bundled_path = bundled["claude-default"]
+
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        user_path = agents_dir / "claude-default.toml"
+        user_path.write_bytes(b'provider = "claude"')
+        monkeypatch.setattr(config_mod, "get_agents_dir", lambda: agents_dir)
+
+        assert dict(list_agent_presets())["claude-default"] == user_path
+        assert config_mod._get_bundled_presets()["claude-default"] == bundled_path
+
 
 class TestSchemaField:
     """Test SchemaField model."""
@@ -404,10 +471,11 @@ class TestSchemaField:
         )
         assert field.type == SchemaFieldType.LIST
 
-    def test_invalid_field_name_rejected(self):
-        """Field name must be valid identifier."""
-        with pytest.raises(ValueError, match="valid identifier"):
-            SchemaField(name="invalid-name")
+    @pytest.mark.parametrize("name", ["invalid-name", "1st", "class"])
+    def test_invalid_field_name_rejected(self, name: str):
+        """Field name must be valid identifier (and not a keyword)."""
+        with pytest.raises(ValueError, match=_INVALID_IDENTIFIER_RE):
+            SchemaField(name=name)
 
     def test_optional_field(self):
         """Schema field can be optional."""
@@ -471,6 +539,12 @@ class TestFeedbackSchema:
         assert pros_prop["type"] == "array"
         assert pros_prop["items"]["type"] == "string"
 
+    @pytest.mark.parametrize("field_type", list(SchemaFieldType))
+    def test_every_field_type_has_json_type(self, field_type):
+        """Every SchemaFieldType renders with a JSON Schema type."""
+        schema = FeedbackSchema(fields=[SchemaField(name="value", type=field_type)])
+        assert schema.to_json_schema()["properties"]["value"]["type"]
+
     def test_schema_to_prompt_instructions(self):
         """Generate prompt instructions from schema."""
         schema = FeedbackSchema(
@@ -507,32 +581,32 @@ class TestSchemaPresets:
         assert "pros-cons" in presets
         assert "review" in presets
 
-    def test_get_rating_preset(self):
-        """Get the rating schema preset."""
-        schema = get_schema_preset("rating")
+    @pytest.mark.parametrize(
+        ("name", "expected_fields"),
+        [
+            ("rating", {"rating", "reasoning"}),
+            ("pros-cons", {"pros", "cons", "summary"}),
+            ("review", {"rating", "pros", "cons", "suggestions"}),
+        ],
+    )
+    def test_get_preset_fields(self, name, expected_fields):
+        """Each built-in preset defines its expected fields."""
+        schema = get_schema_preset(name)
         assert schema is not None
-        field_names = [f.name for f in schema.fields]
-        assert "rating" in field_names
-        assert "reasoning" in field_names
+        assert expected_fields <= {f.name for f in schema.fields}
 
-    def test_get_pros_cons_preset(self):
-        """Get the pros-cons schema preset."""
-        schema = get_schema_preset("pros-cons")
-        assert schema is not None
-        field_names = [f.name for f in schema.fields]
-        assert "pros" in field_names
-        assert "cons" in field_names
-        assert "summary" in field_names
-
-    def test_get_review_preset(self):
-        """Get the full review schema preset."""
-        schema = get_schema_preset("review")
-        assert schema is not None
-        field_names = [f.name for f in schema.fields]
-        assert "rating" in field_names
-        assert "pros" in field_names
-        assert "cons" in field_names
-        assert "suggestions" in field_names
+    def test_presets_are_shared_and_frozen(self):
+        """Presets are shared instances, so they must reject mutation."""
+        schema = get_schema_preset("rating")
+        assert get_schema_preset("rating") is schema
+        with pytest.raises(ValidationError):
+            schema.include_raw_response = False
+        with pytest.raises(ValidationError):
+            schema.fields[0].required = False
+        with pytest.raises(TypeError):
+            schema.fields[0] = SchemaField(name="other")
+        with pytest.raises(AttributeError):
+            schema.fields.append(SchemaField(name="other"))
 
     def test_get_unknown_preset_returns_none(self):
         """Unknown preset returns None."""
@@ -1,9 +1,21 @@
 """Tests for cost estimation module."""
 
+import dataclasses
+
+import pytest
+
+from focusgroup.config import (
+    AgentConfig,
+    FocusgroupConfig,
+    QuestionsConfig,
+    SessionConfig,
+    ToolConfig,
+)
 from focusgroup.costs import (
     CONFIRM_THRESHOLD,
     WARN_THRESHOLD,
     CostEstimate,
+    WarningCode,
     estimate_cost,
     estimate_from_config,
     get_provider_cost,
@@ -12,6 +24,16 @@ from focusgroup.costs import (
 )
 
 
+@pytest.fixture
+def base_config() -> FocusgroupConfig:
+    """Provide a single-agent config to derive estimate_from_config variants from."""
+    return FocusgroupConfig(
+        tool=ToolConfig(command="mytool"),
+        agents=[AgentConfig(provider="claude")],
+        questions=QuestionsConfig(rounds=["Question 1?"]),
+    )
+
+
 class TestGetProviderCost:
     """Tests for get_provider_cost function."""
 
@@ -98,14 +120,20 @@ class TestEstimateCost:
     def test_warnings_for_large_panel(self):
         """Large panel triggers warning."""
         estimate = estimate_cost(agent_count=10, provider="claude")
-        assert len(estimate.warnings) > 0
-        assert any("large panel" in w.lower() for w in estimate.warnings)
+        assert WarningCode.LARGE_PANEL in estimate.warning_codes
+        assert len(estimate.warnings) == len(estimate.warning_codes)
 
     def test_warnings_for_exploration_with_many_agents(self):
         """Exploration with many agents triggers warning."""
         estimate = estimate_cost(agent_count=5, provider="claude", exploration=True)
-        assert len(estimate.warnings) > 0
-        assert any("exploration" in w.lower() for w in estimate.warnings)
+        assert estimate.warning_codes == {WarningCode.EXPLORATION_MANY_AGENTS}
+        assert "exploration" in estimate.warnings[0].lower()
+
+    def test_estimate_is_immutable(self):
+        """Estimates are frozen value objects."""
+        estimate = estimate_cost(agent_count=1, provider="claude")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            estimate.total_cost = 0.0
 
 
 class TestCostEstimateFormatting:
@@ -206,26 +234,10 @@ class TestShouldWarnConfirm:
 class TestEstimateFromConfig:
     """Tests for estimate_from_config function."""
 
-    def test_basic_config(self):
+    def test_basic_config(self, base_config):
         """Estimate from basic config works."""
-        from focusgroup.config import (
-            AgentConfig,
-            FocusgroupConfig,
-            OutputConfig,
-            QuestionsConfig,
-            SessionConfig,
-            ToolConfig,
-        )
-
-        config = FocusgroupConfig(
-            session=SessionConfig(),
-            tool=ToolConfig(command="mytool"),
-            agents=[
-                AgentConfig(provider="claude"),
-                AgentConfig(provider="claude"),
-            ],
-            questions=QuestionsConfig(rounds=["Question 1?"]),
-            output=OutputConfig(),
+        config = base_config.model_copy(
+            update={"agents": [AgentConfig(provider="claude"), AgentConfig(provider="claude")]}
         )
 
         estimate = estimate_from_config(config)
@@ -234,70 +246,27 @@ class TestEstimateFromConfig:
         assert not estimate.is_exploration
         assert not estimate.has_synthesis
 
-    def test_config_with_exploration(self):
-        """Estimate from config with exploration mode."""
-        from focusgroup.config import (
-            AgentConfig,
-            FocusgroupConfig,
-            OutputConfig,
-            QuestionsConfig,
-            SessionConfig,
-            ToolConfig,
-        )
-
-        config = FocusgroupConfig(
-            session=SessionConfig(exploration=True),
-            tool=ToolConfig(command="mytool"),
-            agents=[AgentConfig(provider="claude")],
-            questions=QuestionsConfig(rounds=["Question 1?"]),
-            output=OutputConfig(),
-        )
-
-        estimate = estimate_from_config(config)
-        assert estimate.is_exploration is True
-        assert estimate.exploration_cost > 0
-
-    def test_config_with_moderator(self):
-        """Estimate from config with moderator."""
-        from focusgroup.config import (
-            AgentConfig,
-            FocusgroupConfig,
-            OutputConfig,
-            QuestionsConfig,
-            SessionConfig,
-            ToolConfig,
-        )
-
-        config = FocusgroupConfig(
-            session=SessionConfig(moderator=True),
-            tool=ToolConfig(command="mytool"),
-            agents=[AgentConfig(provider="claude")],
-            questions=QuestionsConfig(rounds=["Question 1?"]),
-            output=OutputConfig(),
-        )
+    @pytest.mark.parametrize(
+        ("session_kwargs", "flag", "cost_field"),
+        [
+            ({"exploration": True}, "is_exploration", "exploration_cost"),
+            ({"moderator": True}, "has_synthesis", "synthesis_cost"),
+        ],
+        ids=["exploration", "moderator"],
+    )
+    def test_config_session_features(self, base_config, session_kwargs, flag, cost_field):
+        """Session features enable their matching cost component."""
+        config = base_config.model_copy(update={"session": SessionConfig(**session_kwargs)})
 
         estimate = estimate_from_config(config)
-        assert estimate.has_synthesis is True
-        assert estimate.synthesis_cost > 0
+        assert getattr(estimate, flag) is True
+        assert getattr(estimate, cost_field) > 0
 
-    def test_config_with_multiple_rounds_warning(self):
+    def test_config_with_multiple_rounds_warning(self, base_config):
         """Multiple rounds trigger warning."""
-        from focusgroup.config import (
-            AgentConfig,
-            FocusgroupConfig,
-            OutputConfig,
-            QuestionsConfig,
-            SessionConfig,
-            ToolConfig,
-        )
-
-        config = FocusgroupConfig(
-            session=SessionConfig(),
-            tool=ToolConfig(command="mytool"),
-            agents=[AgentConfig(provider="claude")],
-            questions=QuestionsConfig(rounds=["Q1?", "Q2?", "Q3?"]),
-            output=OutputConfig(),
+        config = base_config.model_copy(
+            update={"questions": QuestionsConfig(rounds=["Q1?", "Q2?", "Q3?"])}
         )
 
         estimate = estimate_from_config(config)
-        assert any("round" in w.lower() for w in estimate.warnings)
+        assert estimate.warning_codes == {WarningCode.MULTIPLE_ROUNDS}
@@ -1,6 +1,7 @@
 """Unit tests for output formatters."""
 
 import json
+import re
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -9,6 +10,7 @@ import pytest
 from focusgroup.output import (
     JsonWriter,
     MarkdownWriter,
+    OutputFormatter,
     TextWriter,
     format_json,
     format_markdown,
@@ -18,11 +20,16 @@ from focusgroup.output import (
 )
 from focusgroup.storage.session_log import AgentResponse, QuestionRound, SessionLog
 
+_TIMESTAMP_RE = re.compile(r"\d{2}:\d{2}:\d{2}")  # HH:MM:SS
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_session() -> SessionLog:
-    """Create a sample session for testing formatters."""
-    now = datetime.now()
+    """Create a sample session for testing formatters.
+
+    Module-scoped with fixed timestamps; formatters only read the session.
+    """
+    now = datetime(2025, 1, 1, 12, 0, 0)
     return SessionLog(
         id="abc123",
         name="Test Focusgroup",
@@ -64,7 +71,7 @@ def sample_session() -> SessionLog:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_session() -> SessionLog:
     """Create a minimal session with no optional fields."""
     return SessionLog(
@@ -88,6 +95,30 @@ def minimal_session() -> SessionLog:
     )
 
 
+@pytest.fixture(scope="module")
+def markdown_output(sample_session: SessionLog) -> str:
+    """sample_session rendered once with the default MarkdownWriter."""
+    return MarkdownWriter().format(sample_session)
+
+
+@pytest.fixture(scope="module")
+def text_output(sample_session: SessionLog) -> str:
+    """sample_session rendered once with the default TextWriter."""
+    return TextWriter().format(sample_session)
+
+
+@pytest.fixture(scope="module")
+def json_data(sample_session: SessionLog) -> dict:
+    """sample_session rendered with the default JsonWriter and parsed back."""
+    return json.loads(JsonWriter().format(sample_session))
+
+
+@pytest.fixture(scope="module")
+def json_data_no_meta(sample_session: SessionLog) -> dict:
+    """sample_session rendered without metadata and parsed back."""
+    return json.loads(JsonWriter(include_metadata=False).format(sample_session))
+
+
 class TestJsonWriter:
     """Test JSON output formatter."""
 
@@ -112,36 +143,24 @@ class TestJsonWriter:
         data = json.loads(output)
         assert data["tool"] == "mx"
 
-    def test_format_includes_metadata(self, sample_session: SessionLog):
+    def test_format_includes_metadata(self, json_data: dict):
         """JSON includes timing and token metadata by default."""
-        writer = JsonWriter(include_metadata=True)
-        output = writer.format(sample_session)
-        data = json.loads(output)
-
-        response = data["rounds"][0]["responses"][0]
+        response = json_data["rounds"][0]["responses"][0]
         assert "timestamp" in response
         assert "duration_ms" in response
         assert response["duration_ms"] == 1500
         assert response["tokens_used"] == 150
 
-    def test_format_excludes_metadata(self, sample_session: SessionLog):
+    def test_format_excludes_metadata(self, json_data_no_meta: dict):
         """JSON can exclude metadata."""
-        writer = JsonWriter(include_metadata=False)
-        output = writer.format(sample_session)
-        data = json.loads(output)
-
-        response = data["rounds"][0]["responses"][0]
+        response = json_data_no_meta["rounds"][0]["responses"][0]
         assert "timestamp" not in response
         assert "duration_ms" not in response
 
-    def test_format_includes_summary(self, sample_session: SessionLog):
+    def test_format_includes_summary(self, json_data: dict):
         """JSON includes summary statistics."""
-        writer = JsonWriter()
-        output = writer.format(sample_session)
-        data = json.loads(output)
-
-        assert "summary" in data
-        summary = data["summary"]
+        assert "summary" in json_data
+        summary = json_data["summary"]
         assert summary["total_responses"] == 2
         assert "claude" in summary["unique_providers"]
         assert "openai" in summary["unique_providers"]
@@ -158,38 +177,18 @@ class TestJsonWriter:
         assert "name" not in data  # Optional field not included
         assert data["is_complete"] is False
 
-    def test_write_to_file(self, sample_session: SessionLog, tmp_path: Path):
-        """Write JSON to file."""
-        writer = JsonWriter()
-        output_path = tmp_path / "output.json"
-
-        result = writer.write(sample_session, output_path)
-
-        assert result == output_path
-        assert output_path.exists()
-        data = json.loads(output_path.read_text())
-        assert data["tool"] == "mx"
-
-    def test_datetime_serialization(self, sample_session: SessionLog):
+    def test_datetime_serialization(self, json_data: dict):
         """Datetime objects serialize to ISO format."""
-        writer = JsonWriter()
-        output = writer.format(sample_session)
-        data = json.loads(output)
-
         # created_at should be ISO string
-        created_at = data["created_at"]
+        created_at = json_data["created_at"]
         assert isinstance(created_at, str)
         # Should be parseable
         datetime.fromisoformat(created_at)
 
-    def test_round_structure(self, sample_session: SessionLog):
+    def test_round_structure(self, json_data: dict):
         """Rounds have expected structure."""
-        writer = JsonWriter()
-        output = writer.format(sample_session)
-        data = json.loads(output)
-
-        assert len(data["rounds"]) == 1
-        round_data = data["rounds"][0]
+        assert len(json_data["rounds"]) == 1
+        round_data = json_data["rounds"][0]
         assert round_data["round_number"] == 0
         assert round_data["question"] == "How usable is this CLI?"
         assert len(round_data["responses"]) == 2
@@ -205,32 +204,23 @@ class TestJsonWriter:
 class TestMarkdownWriter:
     """Test Markdown output formatter."""
 
-    def test_format_basic(self, sample_session: SessionLog):
+    def test_format_basic(self, markdown_output: str):
         """Basic Markdown formatting."""
-        writer = MarkdownWriter()
-        output = writer.format(sample_session)
+        assert "# Test Focusgroup" in markdown_output
+        assert "**Session ID:**" in markdown_output
+        assert "**Tool:** `mx`" in markdown_output
 
-        assert "# Test Focusgroup" in output
-        assert "**Session ID:**" in output
-        assert "**Tool:** `mx`" in output
-
-    def test_format_includes_overview(self, sample_session: SessionLog):
+    def test_format_includes_overview(self, markdown_output: str):
         """Markdown includes session overview."""
-        writer = MarkdownWriter()
-        output = writer.format(sample_session)
-
-        assert "## Overview" in output
-        assert "**Status:** ✅ Complete" in output
-        assert "**Agents:** 2" in output
-        assert "**Rounds:** 1" in output
+        assert "## Overview" in markdown_output
+        assert "**Status:** ✅ Complete" in markdown_output
+        assert "**Agents:** 2" in markdown_output
+        assert "**Rounds:** 1" in markdown_output
 
-    def test_format_includes_metadata(self, sample_session: SessionLog):
+    def test_format_includes_metadata(self, markdown_output: str):
         """Markdown includes timing metadata by default."""
-        writer = MarkdownWriter(include_metadata=True)
-        output = writer.format(sample_session)
-
-        assert "Total Tokens:" in output
-        assert "350" in output  # 150 + 200 tokens
+        assert "Total Tokens:" in markdown_output
+        assert "350" in markdown_output  # 150 + 200 tokens
 
     def test_format_excludes_metadata(self, sample_session: SessionLog):
         """Markdown can exclude metadata."""
@@ -239,39 +229,27 @@ class TestMarkdownWriter:
 
         assert "Total Tokens:" not in output
 
-    def test_format_round_structure(self, sample_session: SessionLog):
+    def test_format_round_structure(self, markdown_output: str):
         """Markdown formats rounds correctly."""
-        writer = MarkdownWriter()
-        output = writer.format(sample_session)
-
-        assert "## Round 1" in output
-        assert "**Question:** How usable is this CLI?" in output
-        assert "**Claude**" in output
-        assert "**GPT-4**" in output
+        assert "## Round 1" in markdown_output
+        assert "**Question:** How usable is this CLI?" in markdown_output
+        assert "**Claude**" in markdown_output
+        assert "**GPT-4**" in markdown_output
 
-    def test_format_blockquote_responses(self, sample_session: SessionLog):
+    def test_format_blockquote_responses(self, markdown_output: str):
         """Agent responses are in blockquotes."""
-        writer = MarkdownWriter()
-        output = writer.format(sample_session)
+        assert "> The CLI has a clean interface" in markdown_output
+        assert "> Good overall structure" in markdown_output
 
-        assert "> The CLI has a clean interface" in output
-        assert "> Good overall structure" in output
-
-    def test_format_moderator_synthesis(self, sample_session: SessionLog):
+    def test_format_moderator_synthesis(self, markdown_output: str):
         """Moderator synthesis is included."""
-        writer = MarkdownWriter()
-        output = writer.format(sample_session)
-
-        assert "Round Synthesis" in output
-        assert "Both agents appreciate" in output
+        assert "Round Synthesis" in markdown_output
+        assert "Both agents appreciate" in markdown_output
 
-    def test_format_final_synthesis(self, sample_session: SessionLog):
+    def test_format_final_synthesis(self, markdown_output: str):
         """Final synthesis section is included."""
-        writer = MarkdownWriter()
-        output = writer.format(sample_session)
-
-        assert "# Final Synthesis" in output
-        assert "well-designed with room for improvement" in output
+        assert "# Final Synthesis" in markdown_output
+        assert "well-designed with room for improvement" in markdown_output
 
     def test_custom_heading_level(self, sample_session: SessionLog):
         """Can start at different heading level."""
@@ -289,23 +267,7 @@ class TestMarkdownWriter:
         output = writer.format(sample_session)
 
         # Should have time in HH:MM:SS format in the response metadata
-        # Look for the timestamp pattern in the output
-        import re
-
-        timestamp_pattern = r"\d{2}:\d{2}:\d{2}"  # HH:MM:SS
-        assert re.search(timestamp_pattern, output), f"No timestamp found in output: {output[:500]}"
-
-    def test_write_to_file(self, sample_session: SessionLog, tmp_path: Path):
-        """Write Markdown to file."""
-        writer = MarkdownWriter()
-        output_path = tmp_path / "output.md"
-
-        result = writer.write(sample_session, output_path)
-
-        assert result == output_path
-        assert output_path.exists()
-        content = output_path.read_text()
-        assert "# Test Focusgroup" in content
+        assert _TIMESTAMP_RE.search(output), f"No timestamp found in output: {output[:500]}"
 
     def test_format_minimal_session(self, minimal_session: SessionLog):
         """Markdown handles minimal session."""
@@ -354,66 +316,45 @@ class TestMarkdownWriter:
 class TestTextWriter:
     """Test plain text output formatter."""
 
-    def test_format_basic(self, sample_session: SessionLog):
+    def test_format_basic(self, sample_session: SessionLog, text_output: str):
         """Basic text formatting."""
-        writer = TextWriter()
-        output = writer.format(sample_session)
-
         # Title shows the session name when available
-        assert "Test Focusgroup" in output
-        assert "Session: " in output
+        assert "Test Focusgroup" in text_output
+        assert "Session: " in text_output
         # Tool name may not be shown in title when session has a name,
         # but session ID should be present
-        assert sample_session.display_id in output
+        assert sample_session.display_id in text_output
 
-    def test_format_separator_lines(self, sample_session: SessionLog):
+    def test_format_separator_lines(self, text_output: str):
         """Text has separator lines."""
-        writer = TextWriter(width=80)
-        output = writer.format(sample_session)
-
         # Should have '=' separators
-        assert "=" * 80 in output
+        assert "=" * 80 in text_output
         # Should have '-' separators
-        assert "-" * 80 in output
+        assert "-" * 80 in text_output
 
-    def test_format_round_structure(self, sample_session: SessionLog):
+    def test_format_round_structure(self, text_output: str):
         """Text formats rounds correctly."""
-        writer = TextWriter()
-        output = writer.format(sample_session)
+        assert "ROUND 1:" in text_output
+        assert "[Claude]" in text_output
+        assert "[GPT-4]" in text_output
 
-        assert "ROUND 1:" in output
-        assert "[Claude]" in output
-        assert "[GPT-4]" in output
-
-    def test_format_status(self, sample_session: SessionLog):
+    def test_format_status(self, text_output: str):
         """Status is shown."""
-        writer = TextWriter()
-        output = writer.format(sample_session)
-
-        assert "Status: Complete" in output
+        assert "Status: Complete" in text_output
 
-    def test_format_mode(self, sample_session: SessionLog):
+    def test_format_mode(self, text_output: str):
         """Mode is shown."""
-        writer = TextWriter()
-        output = writer.format(sample_session)
-
-        assert "Mode: single" in output
+        assert "Mode: single" in text_output
 
-    def test_format_moderator_synthesis(self, sample_session: SessionLog):
+    def test_format_moderator_synthesis(self, text_output: str):
         """Moderator synthesis is shown."""
-        writer = TextWriter()
-        output = writer.format(sample_session)
+        assert "[Moderator Synthesis]" in text_output
+        assert "Both agents appreciate" in text_output
 
-        assert "[Moderator Synthesis]" in output
-        assert "Both agents appreciate" in output
-
-    def test_format_final_synthesis(self, sample_session: SessionLog):
+    def test_format_final_synthesis(self, text_output: str):
         """Final synthesis section is shown."""
-        writer = TextWriter()
-        output = writer.format(sample_session)
-
-        assert "FINAL SYNTHESIS" in output
-        assert "well-designed with room for improvement" in output
+        assert "FINAL SYNTHESIS" in text_output
+        assert "well-designed with room for improvement" in text_output
 
     def test_custom_width(self, sample_session: SessionLog):
         """Can use custom width for separators."""
@@ -422,16 +363,6 @@ class TestTextWriter:
 
         assert "=" * 60 in output
 
-    def test_write_to_file(self, sample_session: SessionLog, tmp_path: Path):
-        """Write text to file."""
-        writer = TextWriter()
-        output_path = tmp_path / "output.txt"
-
-        result = writer.write(sample_session, output_path)
-
-        assert result == output_path
-        assert output_path.exists()
-
     def test_format_minimal_session(self, minimal_session: SessionLog):
         """Text handles minimal session."""
         writer = TextWriter()
@@ -446,133 +377,109 @@ class TestTextWriter:
         assert "Test Focusgroup" in output
 
 
+@pytest.fixture(scope="module")
+def out_dir(tmp_path_factory) -> Path:
+    """One output directory shared by the write tests."""
+    return tmp_path_factory.mktemp("outputs")
+
+
+class TestWriteToFile:
+    """Test writing formatted output to disk."""
+
+    @pytest.mark.parametrize(
+        ("writer_cls", "filename", "expected"),
+        [
+            (JsonWriter, "output.json", '"tool": "mx"'),
+            (MarkdownWriter, "output.md", "# Test Focusgroup"),
+            (TextWriter, "output.txt", "Test Focusgroup"),
+        ],
+    )
+    def test_write_to_file(self, sample_session, out_dir, writer_cls, filename, expected):
+        """Each writer writes its formatted output to the given path."""
+        output_path = out_dir / filename
+
+        result = writer_cls().write(sample_session, output_path)
+
+        assert result == output_path
+        assert expected in output_path.read_text()
+
+
 class TestJsonRoundTrip:
     """Test JSON serialization round-trip."""
 
-    def test_json_roundtrip(self, sample_session: SessionLog):
+    def test_json_roundtrip(self, sample_session: SessionLog, json_data: dict):
         """Session survives JSON serialization and deserialization."""
-        writer = JsonWriter()
-        json_output = writer.format(sample_session)
-
-        # Parse back
-        data = json.loads(json_output)
-
         # Key fields preserved
-        assert data["tool"] == sample_session.tool
-        assert data["mode"] == sample_session.mode
-        assert data["agent_count"] == sample_session.agent_count
-        assert len(data["rounds"]) == len(sample_session.rounds)
+        assert json_data["tool"] == sample_session.tool
+        assert json_data["mode"] == sample_session.mode
+        assert json_data["agent_count"] == sample_session.agent_count
+        assert len(json_data["rounds"]) == len(sample_session.rounds)
 
         # Response content preserved
         original_response = sample_session.rounds[0].responses[0].response
-        parsed_response = data["rounds"][0]["responses"][0]["response"]
+        parsed_response = json_data["rounds"][0]["responses"][0]["response"]
         assert parsed_response == original_response
 
     def test_json_idempotent(self, sample_session: SessionLog):
         """Formatting same session twice gives identical output."""
         writer = JsonWriter(pretty=True)
 
-        output1 = writer.format(sample_session)
-        output2 = writer.format(sample_session)
-
-        # Parse and compare (timestamps might differ in format)
-        data1 = json.loads(output1)
-        data2 = json.loads(output2)
-        assert data1 == data2
+        assert writer.format(sample_session) == writer.format(sample_session)
 
 
 class TestGetFormatter:
     """Test get_formatter factory function."""
 
-    def test_get_json_formatter(self):
-        """Get JSON formatter."""
-        formatter = get_formatter("json")
-        assert isinstance(formatter, JsonWriter)
-
-    def test_get_markdown_formatter(self):
-        """Get Markdown formatter."""
-        formatter = get_formatter("markdown")
-        assert isinstance(formatter, MarkdownWriter)
-
-    def test_get_md_alias(self):
-        """Get Markdown formatter via 'md' alias."""
-        formatter = get_formatter("md")
-        assert isinstance(formatter, MarkdownWriter)
-
-    def test_get_text_formatter(self):
-        """Get Text formatter."""
-        formatter = get_formatter("text")
-        assert isinstance(formatter, TextWriter)
-
-    def test_get_txt_alias(self):
-        """Get Text formatter via 'txt' alias."""
-        formatter = get_formatter("txt")
-        assert isinstance(formatter, TextWriter)
-
-    def test_case_insensitive(self):
-        """Format type is case insensitive."""
-        assert isinstance(get_formatter("JSON"), JsonWriter)
-        assert isinstance(get_formatter("MARKDOWN"), MarkdownWriter)
-        assert isinstance(get_formatter("Text"), TextWriter)
+    @pytest.mark.parametrize(
+        ("format_type", "expected_cls"),
+        [
+            ("json", JsonWriter),
+            ("markdown", MarkdownWriter),
+            ("md", MarkdownWriter),
+            ("text", TextWriter),
+            ("txt", TextWriter),
+            ("JSON", JsonWriter),
+            ("MARKDOWN", MarkdownWriter),
+            ("Text", TextWriter),
+        ],
+    )
+    def test_get_formatter(self, format_type, expected_cls):
+        """Names and aliases resolve case-insensitively to their writer."""
+        assert isinstance(get_formatter(format_type), expected_cls)
 
     def test_invalid_format_raises(self):
-        """Invalid format type raises ValueError."""
-        with pytest.raises(ValueError, match="Unknown format type"):
-            get_formatter("invalid")
-
-    def test_invalid_format_shows_valid_options(self):
-        """Error message shows valid options."""
-        with pytest.raises(ValueError, match="json"):
+        """Invalid format type raises ValueError listing the valid options."""
+        with pytest.raises(ValueError, match="Unknown format type") as exc_info:
             get_formatter("invalid")
+        assert "json" in str(exc_info.value)
 
 
 class TestFormatSession:
     """Test format_session convenience function."""
 
-    def test_format_session_text(self, sample_session: SessionLog):
-        """format_session with text format."""
-        output = format_session(sample_session, "text")
-        assert "Test Focusgroup" in output
-        # Text format uses === separators
-        assert "=" * 80 in output
-
-    def test_format_session_json(self, sample_session: SessionLog):
-        """format_session with JSON format."""
-        output = format_session(sample_session, "json")
-        data = json.loads(output)
-        assert data["tool"] == "mx"
-
-    def test_format_session_markdown(self, sample_session: SessionLog):
-        """format_session with Markdown format."""
-        output = format_session(sample_session, "markdown")
-        assert "# Test Focusgroup" in output
+    @pytest.mark.parametrize(
+        ("format_args", "expected"),
+        [
+            (("text",), "=" * 80),
+            (("json",), '"tool": "mx"'),
+            (("markdown",), "# Test Focusgroup"),
+            ((), "=" * 80),
+        ],
+        ids=["text", "json", "markdown", "default-text"],
+    )
+    def test_format_session(self, sample_session: SessionLog, format_args, expected):
+        """format_session dispatches to the named format, defaulting to text."""
+        assert expected in format_session(sample_session, *format_args)
 
-    def test_format_session_default_text(self, sample_session: SessionLog):
-        """format_session defaults to text format."""
-        output = format_session(sample_session)
-        # Text format uses === separators
-        assert "=" * 80 in output
+    def test_format_session_json_parses(self, sample_session: SessionLog):
+        """format_session JSON output is valid JSON."""
+        assert json.loads(format_session(sample_session, "json"))["tool"] == "mx"
 
 
 class TestOutputFormatterProtocol:
     """Test that formatters satisfy the OutputFormatter protocol."""
 
-    def test_json_writer_has_format_method(self):
-        """JsonWriter has format method required by protocol."""
-        writer = JsonWriter()
-        assert hasattr(writer, "format")
-        assert callable(writer.format)
-
-    def test_markdown_writer_has_write_method(self):
-        """MarkdownWriter has write method required by protocol."""
-        writer = MarkdownWriter()
-        assert hasattr(writer, "write")
-        assert callable(writer.write)
-
-    def test_text_writer_has_both_methods(self):
-        """TextWriter has both required protocol methods."""
-        writer = TextWriter()
-        assert hasattr(writer, "format")
-        assert hasattr(writer, "write")
-        assert callable(writer.format)
-        assert callable(writer.write)
+    @pytest.mark.parametrize("writer_cls", [JsonWriter, MarkdownWriter, TextWriter])
+    def test_writer_satisfies_protocol(self, writer_cls):
+        """Each writer provides the format and write methods of OutputFormatter."""
+        assert isinstance(writer_cls(), OutputFormatter)
@@ -185,6 +185,17 @@ class TestSessionStorage:
         assert data["id"] == sample_session.id
         assert data["tool"] == "mx"
 
+    def test_save_overwrites_without_temp_files(
+        self, storage: SessionStorage, sample_session: SessionLog
+    ):
+        """Re-saving replaces the log in place and leaves no temp files behind."""
+        storage.save(sample_session)
+        updated = sample_session.model_copy(update={"final_synthesis": "Updated"})
+        path = storage.save(updated)
+
+        assert storage.load(sample_session.display_id).final_synthesis == "Updated"
+        assert [p.name for p in storage.base_dir.iterdir()] == [path.name]
+
     def test_load_by_display_id(self, storage: SessionStorage, sample_session: SessionLog):
         """Load session by display ID."""
         storage.save(sample_session)